@@ -1,6 +1,9 @@
 import os
+import sys
 from pathlib import Path
 
+from validate_signature_project import validate_files
+
 BASE_DIR = Path("signature-integration")
 
 FILES = {
@@ -25,6 +28,8 @@ FILES = {
         <google-cloud-tasks.version>2.40.0</google-cloud-tasks.version>
         <mockk.version>1.13.8</mockk.version>
         <hypersistence-utils.version>3.7.0</hypersistence-utils.version>
+        <datasource-micrometer.version>1.0.3</datasource-micrometer.version>
+        <resilience4j.version>2.2.0</resilience4j.version>
     </properties>
     <dependencyManagement>
         <dependencies>
@@ -58,6 +63,23 @@ FILES = {
             <groupId>org.springframework.boot</groupId>
             <artifactId>spring-boot-starter-actuator</artifactId>
         </dependency>
+        <dependency>
+            <groupId>io.micrometer</groupId>
+            <artifactId>micrometer-registry-prometheus</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>io.micrometer</groupId>
+            <artifactId>micrometer-tracing-bridge-otel</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>io.opentelemetry</groupId>
+            <artifactId>opentelemetry-exporter-otlp</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>net.ttddyy.observation</groupId>
+            <artifactId>datasource-micrometer-spring-boot</artifactId>
+            <version>${datasource-micrometer.version}</version>
+        </dependency>
         <dependency>
             <groupId>org.postgresql</groupId>
             <artifactId>postgresql</artifactId>
@@ -88,7 +110,7 @@ FILES = {
         </dependency>
         <dependency>
             <groupId>com.google.cloud</groupId>
-            <artifactId>spring-cloud-gcp-starter-storage</artifactId>
+            <artifactId>google-cloud-storage</artifactId>
         </dependency>
         <dependency>
             <groupId>com.google.cloud</groupId>
@@ -96,8 +118,9 @@ FILES = {
             <version>${google-cloud-tasks.version}</version>
         </dependency>
         <dependency>
-            <groupId>org.springframework.boot</groupId>
-            <artifactId>spring-boot-starter-webflux</artifactId>
+            <groupId>io.github.resilience4j</groupId>
+            <artifactId>resilience4j-spring-boot3</artifactId>
+            <version>${resilience4j.version}</version>
         </dependency>
         <dependency>
             <groupId>io.hypersistence</groupId>
@@ -139,6 +162,30 @@ FILES = {
             </plugin>
         </plugins>
     </build>
+    <profiles>
+        <profile>
+            <id>fast-startup</id>
+            <build>
+                <plugins>
+                    <plugin>
+                        <groupId>org.springframework.boot</groupId>
+                        <artifactId>spring-boot-maven-plugin</artifactId>
+                        <executions>
+                            <execution>
+                                <id>process-aot</id>
+                                <goals>
+                                    <goal>process-aot</goal>
+                                </goals>
+                                <configuration>
+                                    <profiles>fast-startup</profiles>
+                                </configuration>
+                            </execution>
+                        </executions>
+                    </plugin>
+                </plugins>
+            </build>
+        </profile>
+    </profiles>
 </project>
 """,
 
@@ -146,9 +193,11 @@ FILES = {
     "src/main/kotlin/com/yourcompany/signature/SignatureIntegrationApplication.kt": """package com.yourcompany.signature
 
 import org.springframework.boot.autoconfigure.SpringBootApplication
+import org.springframework.boot.context.properties.ConfigurationPropertiesScan
 import org.springframework.boot.runApplication
 
 @SpringBootApplication
+@ConfigurationPropertiesScan
 class SignatureIntegrationApplication
 
 fun main(args: Array<String>) {
@@ -160,11 +209,14 @@ fun main(args: Array<String>) {
     "src/main/resources/application.yml": """spring:
   application:
     name: signature-integration
+  config:
+    import: optional:sm://
   datasource:
     url: jdbc:postgresql://${DB_HOST:localhost}:${DB_PORT:5432}/${DB_NAME:signature_db}
     username: ${DB_USER:postgres}
     password: ${DB_PASSWORD:postgres}
   jpa:
+    open-in-view: false
     hibernate:
       ddl-auto: validate
     show-sql: false
@@ -182,18 +234,22 @@ fun main(args: Array<String>) {
         location: ${GOOGLE_APPLICATION_CREDENTIALS:}
       secretmanager:
         enabled: true
-      storage:
-        enabled: true
 
 gcp:
   project-id: ${GCP_PROJECT_ID}
   location: ${GCP_LOCATION:us-central1}
   storage:
     bucket-name: ${GCS_BUCKET_NAME}
+    uploaded-hash-cache-size: ${GCS_UPLOADED_HASH_CACHE_SIZE:10000}
+    emulator-host: ${GCS_EMULATOR_HOST:}
+  tasks:
+    emulator-host: ${CLOUD_TASKS_EMULATOR_HOST:}
 
 app:
   internal:
     url: ${INTERNAL_URL:http://signature-integration-service.default.svc.cluster.local}
+    username: ${INTERNAL_USERNAME:${spring.security.user.name:user}}
+    password: ${INTERNAL_PASSWORD:${spring.security.user.password:}}
 
 signature:
   webhook:
@@ -202,21 +258,86 @@ signature:
   certisign:
     api:
       base-url: ${CERTISIGN_BASE_URL:https://api.certisign.com.br}
-      token: ${CERTISIGN_API_TOKEN}
+      token: ${CERTISIGN_API_TOKEN:${sm://certisign-api-token}}
   docusign:
     api:
       base-url: ${DOCUSIGN_BASE_URL:https://demo.docusign.net}
       account-id: ${DOCUSIGN_ACCOUNT_ID}
-      access-token: ${DOCUSIGN_ACCESS_TOKEN}
+      access-token: ${DOCUSIGN_ACCESS_TOKEN:}
+    auth:
+      base-url: ${DOCUSIGN_AUTH_BASE_URL:https://account-d.docusign.com}
+      integration-key: ${DOCUSIGN_INTEGRATION_KEY:}
+      user-id: ${DOCUSIGN_USER_ID:}
+      private-key: ${DOCUSIGN_PRIVATE_KEY:${sm://docusign-private-key}}
+      token-lifetime: 3600s
+  scheduler:
+    check-status-cron: ${CHECK_STATUS_CRON:0 0 1 * * *}
+    mark-expired-cron: ${MARK_EXPIRED_CRON:0 0 1 * * *}
+    process-signed-cron: ${PROCESS_SIGNED_CRON:0 */30 * * * *}
+  auth:
+    refresh-skew: 60s
+    failure-backoff: 5s
+  resilience:
+    providers:
+      certisign:
+        requests-per-second: ${CERTISIGN_REQUESTS_PER_SECOND:10}
+        burst: 10
+        acquire-timeout: 2s
+        initial-concurrency: 4
+        min-concurrency: 1
+        max-concurrency: 20
+        latency-threshold: 5s
+        backoff-ratio: 0.7
+      docusign:
+        requests-per-second: ${DOCUSIGN_REQUESTS_PER_SECOND:10}
+        burst: 10
+        acquire-timeout: 2s
+        initial-concurrency: 4
+        min-concurrency: 1
+        max-concurrency: 20
+        latency-threshold: 5s
+        backoff-ratio: 0.7
+
+resilience4j:
+  circuitbreaker:
+    configs:
+      default:
+        sliding-window-type: COUNT_BASED
+        sliding-window-size: 20
+        minimum-number-of-calls: 10
+        failure-rate-threshold: 50
+        slow-call-duration-threshold: 10s
+        slow-call-rate-threshold: 80
+        wait-duration-in-open-state: 30s
+        permitted-number-of-calls-in-half-open-state: 3
+    instances:
+      certisign:
+        base-config: default
+      docusign:
+        base-config: default
 
 management:
   endpoints:
     web:
       exposure:
-        include: health,info,metrics
+        include: health,info,metrics,prometheus
   endpoint:
     health:
       show-details: when-authorized
+      probes:
+        enabled: true
+  metrics:
+    distribution:
+      percentiles-histogram:
+        signature: true
+    tags:
+      application: ${spring.application.name}
+  tracing:
+    sampling:
+      probability: ${TRACING_SAMPLING_PROBABILITY:0.1}
+    propagation:
+      type: w3c
+  # Exportação OTLP só é ativada quando MANAGEMENT_OTLP_TRACING_ENDPOINT é definido
 
 logging:
   level:
@@ -224,6 +345,578 @@ logging:
     com.yourcompany.signature: DEBUG
 """,
 
+    # Fast startup profile
+    "src/main/resources/application-fast-startup.yml": """spring:
+  main:
+    lazy-initialization: true
+  jmx:
+    enabled: false
+  jpa:
+    properties:
+      hibernate:
+        temp:
+          use_jdbc_metadata_defaults: false
+  data:
+    jpa:
+      repositories:
+        bootstrap-mode: deferred
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/config/CloudTasksConfig.kt": """package com.yourcompany.signature.config
+
+import com.google.api.gax.core.NoCredentialsProvider
+import com.google.api.gax.grpc.GrpcTransportChannel
+import com.google.api.gax.rpc.FixedTransportChannelProvider
+import com.google.cloud.tasks.v2.CloudTasksClient
+import com.google.cloud.tasks.v2.CloudTasksSettings
+import io.grpc.ManagedChannelBuilder
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+class CloudTasksConfig {
+    @Bean(destroyMethod = "")
+    fun cloudTasksClient(
+        @Value("\${gcp.tasks.emulator-host:}") emulatorHost: String
+    ): CloudTasksClient {
+        if (emulatorHost.isBlank()) {
+            return CloudTasksClient.create()
+        }
+
+        val channel = ManagedChannelBuilder.forTarget(emulatorHost).usePlaintext().build()
+        val settings = CloudTasksSettings.newBuilder()
+            .setTransportChannelProvider(FixedTransportChannelProvider.create(GrpcTransportChannel.create(channel)))
+            .setCredentialsProvider(NoCredentialsProvider.create())
+            .build()
+        return CloudTasksClient.create(settings)
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/config/GcpConfig.kt": """package com.yourcompany.signature.config
+
+import com.google.cloud.NoCredentials
+import com.google.cloud.storage.Storage
+import com.google.cloud.storage.StorageOptions
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+class GcpConfig {
+    @Bean
+    fun storage(
+        @Value("\${gcp.project-id}") projectId: String,
+        @Value("\${gcp.storage.emulator-host:}") emulatorHost: String
+    ): Storage {
+        val options = StorageOptions.newBuilder().setProjectId(projectId)
+        if (emulatorHost.isNotBlank()) {
+            options.setHost(emulatorHost).setCredentials(NoCredentials.getInstance())
+        }
+        return options.build().service
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/config/StartupConfig.kt": """package com.yourcompany.signature.config
+
+import com.yourcompany.signature.service.CloudTasksService
+import com.yourcompany.signature.service.GcsStorageService
+import com.yourcompany.signature.service.SignatureEventService
+import com.yourcompany.signature.service.provider.SignatureProviderFactory
+import com.yourcompany.signature.service.provider.auth.ProviderTokenManager
+import org.springframework.boot.LazyInitializationExcludeFilter
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+class StartupConfig {
+    companion object {
+        @JvmStatic
+        @Bean
+        fun eagerSignatureBeans(): LazyInitializationExcludeFilter =
+            LazyInitializationExcludeFilter.forBeanTypes(
+                SignatureEventService::class.java,
+                CloudTasksService::class.java,
+                GcsStorageService::class.java,
+                SignatureProviderFactory::class.java,
+                ProviderTokenManager::class.java
+            )
+    }
+}
+""",
+
+    "docker/Dockerfile.fast-startup": """FROM maven:3.9-eclipse-temurin-17 AS build
+WORKDIR /app
+COPY pom.xml .
+COPY src ./src
+RUN mvn -q -Pfast-startup -DskipTests package \\
+    && mkdir unpacked && cd unpacked && jar xf ../target/signature-integration-1.0.0.jar
+
+FROM eclipse-temurin:17-jre AS cds
+WORKDIR /app
+COPY --from=build /app/unpacked ./unpacked
+ENV SPRING_PROFILES_ACTIVE=fast-startup \\
+    SPRING_FLYWAY_ENABLED=false \\
+    SPRING_JPA_HIBERNATE_DDL_AUTO=none \\
+    SPRING_CLOUD_GCP_CORE_ENABLED=false \\
+    SPRING_CLOUD_GCP_SECRETMANAGER_ENABLED=false \\
+    SPRING_CONFIG_IMPORT= \\
+    GCS_EMULATOR_HOST=http://localhost:4443 \\
+    CLOUD_TASKS_EMULATOR_HOST=localhost:8123 \\
+    GCP_PROJECT_ID=cds-training \\
+    GCS_BUCKET_NAME=cds-training \\
+    WEBHOOK_PASSWORD=cds-training \\
+    CERTISIGN_API_TOKEN=cds-training \\
+    DOCUSIGN_ACCESS_TOKEN=cds-training \\
+    DOCUSIGN_PRIVATE_KEY=cds-training
+RUN java -XX:ArchiveClassesAtExit=app.jsa \\
+    -Dspring.aot.enabled=true \\
+    -Dspring.context.exit=onRefresh \\
+    -cp "unpacked/BOOT-INF/classes:unpacked/BOOT-INF/lib/*" \\
+    com.yourcompany.signature.SignatureIntegrationApplicationKt
+
+FROM eclipse-temurin:17-jre
+WORKDIR /app
+COPY --from=cds /app/unpacked ./unpacked
+COPY --from=cds /app/app.jsa ./app.jsa
+ENV SPRING_PROFILES_ACTIVE=fast-startup
+EXPOSE 8080
+ENTRYPOINT ["java", "-XX:SharedArchiveFile=app.jsa", "-Dspring.aot.enabled=true", "-cp", "unpacked/BOOT-INF/classes:unpacked/BOOT-INF/lib/*", "com.yourcompany.signature.SignatureIntegrationApplicationKt"]
+""",
+
+    "scripts/startup-benchmark.sh": """#!/usr/bin/env bash
+# Mede o tempo até /actuator/health/readiness responder 200, comparando
+# o build padrão com o perfil fast-startup (AOT + CDS + lazy init).
+# Os dois builds sobem do mesmo classpath explodido, para que a diferença
+# venha só de AOT, CDS e lazy init.
+# Requer Postgres e variáveis de ambiente da aplicação (ver PLAN.md).
+set -euo pipefail
+
+RUNS=${RUNS:-5}
+PORT=${PORT:-8080}
+JAR=target/signature-integration-1.0.0.jar
+UNPACKED=target/unpacked
+CLASSPATH="$UNPACKED/BOOT-INF/classes:$UNPACKED/BOOT-INF/lib/*"
+MAIN_CLASS=com.yourcompany.signature.SignatureIntegrationApplicationKt
+
+measure() {
+    local label=$1
+    shift
+    local total=0
+    for run in $(seq 1 "$RUNS"); do
+        local start
+        start=$(date +%s%3N)
+        "$@" --server.port="$PORT" > "target/startup-$label-$run.log" 2>&1 &
+        local pid=$!
+        until curl -sf "http://localhost:$PORT/actuator/health/readiness" > /dev/null; do
+            if ! kill -0 "$pid" 2> /dev/null; then
+                echo "$label: aplicação encerrou, veja target/startup-$label-$run.log" >&2
+                exit 1
+            fi
+            sleep 0.05
+        done
+        local elapsed=$(( $(date +%s%3N) - start ))
+        total=$(( total + elapsed ))
+        echo "$label run $run: ${elapsed}ms"
+        kill "$pid"
+        wait "$pid" 2> /dev/null || true
+    done
+    echo "$label média: $(( total / RUNS ))ms"
+}
+
+unpack() {
+    rm -rf "$UNPACKED" && mkdir -p "$UNPACKED" && (cd "$UNPACKED" && jar xf "../../$JAR")
+}
+
+${MVN:-mvn} -q -DskipTests package
+unpack
+measure default java -cp "$CLASSPATH" "$MAIN_CLASS"
+
+${MVN:-mvn} -q -Pfast-startup -DskipTests package
+unpack
+SPRING_PROFILES_ACTIVE=fast-startup java -XX:ArchiveClassesAtExit=target/app.jsa \\
+    -Dspring.aot.enabled=true -Dspring.context.exit=onRefresh \\
+    -cp "$CLASSPATH" "$MAIN_CLASS" > target/startup-cds-training.log 2>&1
+SPRING_PROFILES_ACTIVE=fast-startup measure fast-startup java -XX:SharedArchiveFile=target/app.jsa \\
+    -Dspring.aot.enabled=true -cp "$CLASSPATH" "$MAIN_CLASS"
+""",
+
+    # Load test
+    "load-test/docker-compose.yml": """services:
+  postgres:
+    image: postgres:16-alpine
+    environment:
+      POSTGRES_DB: signature_db
+      POSTGRES_USER: postgres
+      POSTGRES_PASSWORD: postgres
+    healthcheck:
+      test: ["CMD-SHELL", "pg_isready -U postgres"]
+      interval: 2s
+      retries: 30
+
+  fake-gcs:
+    image: fsouza/fake-gcs-server:1.47
+    command: ["-scheme", "http", "-port", "4443", "-public-host", "fake-gcs:4443"]
+    volumes:
+      - ./fake-gcs-data:/data
+
+  cloud-tasks:
+    image: ghcr.io/aertje/cloud-tasks-emulator:1.2.0
+    command:
+      - -host=0.0.0.0
+      - -port=8123
+      - -queue=projects/signature-loadtest/locations/us-central1/queues/send-signature-queue
+      - -queue=projects/signature-loadtest/locations/us-central1/queues/check-signature-status-queue
+      - -queue=projects/signature-loadtest/locations/us-central1/queues/upload-signed-queue
+
+  provider-stub:
+    image: python:3.12-alpine
+    command: ["python", "/stubs/provider_stub.py"]
+    environment:
+      PORT: "8090"
+      LATENCY_MS: ${PROVIDER_LATENCY_MS:-300}
+      LATENCY_JITTER_MS: ${PROVIDER_LATENCY_JITTER_MS:-100}
+      THROTTLE_RATIO: ${PROVIDER_THROTTLE_RATIO:-0}
+      SIGNED_AFTER_SECONDS: ${PROVIDER_SIGNED_AFTER_SECONDS:-30}
+    volumes:
+      - ./stubs:/stubs
+
+  app:
+    build:
+      context: ..
+      dockerfile: docker/Dockerfile.fast-startup
+    ports:
+      - "8080:8080"
+    environment:
+      DB_HOST: postgres
+      GCP_PROJECT_ID: signature-loadtest
+      GCP_LOCATION: us-central1
+      GCS_BUCKET_NAME: signature-loadtest
+      GCS_EMULATOR_HOST: http://fake-gcs:4443
+      CLOUD_TASKS_EMULATOR_HOST: cloud-tasks:8123
+      INTERNAL_URL: http://app:8080
+      SPRING_CONFIG_IMPORT: ""
+      SPRING_CLOUD_GCP_CORE_ENABLED: "false"
+      SPRING_CLOUD_GCP_SECRETMANAGER_ENABLED: "false"
+      SPRING_SECURITY_USER_NAME: loadtest
+      SPRING_SECURITY_USER_PASSWORD: loadtest
+      WEBHOOK_PASSWORD: loadtest
+      CERTISIGN_BASE_URL: http://provider-stub:8090
+      CERTISIGN_API_TOKEN: loadtest
+      DOCUSIGN_BASE_URL: http://provider-stub:8090
+      DOCUSIGN_ACCOUNT_ID: loadtest
+      DOCUSIGN_ACCESS_TOKEN: loadtest
+      DOCUSIGN_PRIVATE_KEY: loadtest
+      TRACING_SAMPLING_PROBABILITY: "0"
+      CHECK_STATUS_CRON: ${SWEEP_CRON:-*/30 * * * * *}
+      MARK_EXPIRED_CRON: ${SWEEP_CRON:-*/30 * * * * *}
+      PROCESS_SIGNED_CRON: ${SWEEP_CRON:-*/30 * * * * *}
+    depends_on:
+      postgres:
+        condition: service_healthy
+      fake-gcs:
+        condition: service_started
+      cloud-tasks:
+        condition: service_started
+      provider-stub:
+        condition: service_started
+
+  k6:
+    image: grafana/k6:0.49.0
+    profiles: ["run"]
+    command: ["run", "/scripts/create-events.js"]
+    environment:
+      BASE_URL: http://app:8080
+      APP_USER: loadtest
+      APP_PASSWORD: loadtest
+      RATE: ${RATE:-50}
+      DURATION: ${DURATION:-2m}
+      PROVIDER: ${PROVIDER:-CERTISIGN}
+      UNIQUE_DOCUMENTS: ${UNIQUE_DOCUMENTS:-false}
+    volumes:
+      - ./k6:/scripts
+    depends_on:
+      - app
+""",
+
+    "load-test/stubs/provider_stub.py": """# Stub HTTP dos providers (Certisign e DocuSign) com latência configurável.
+import json
+import os
+import random
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = int(os.environ.get("PORT", "8090"))
+LATENCY_MS = int(os.environ.get("LATENCY_MS", "300"))
+LATENCY_JITTER_MS = int(os.environ.get("LATENCY_JITTER_MS", "100"))
+THROTTLE_RATIO = float(os.environ.get("THROTTLE_RATIO", "0"))
+SIGNED_AFTER_SECONDS = int(os.environ.get("SIGNED_AFTER_SECONDS", "30"))
+
+# PDF mínimo ("%PDF-1.4") em base64
+SIGNED_CONTENT = "JVBERi0xLjQK"
+
+envelopes = {}
+
+
+class ProviderStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        # Consome o corpo antes de responder para não corromper a conexão keep-alive
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        self._simulate_latency()
+        if self._throttled():
+            return
+        envelope_id = str(uuid.uuid4())
+        envelopes[envelope_id] = time.time()
+        if self.path.startswith("/restapi/"):
+            self._send_json(201, {"envelopeId": envelope_id, "status": "sent"})
+        else:
+            self._send_json(201, {"envelope_id": envelope_id, "status": "pending"})
+
+    def do_GET(self):
+        self._simulate_latency()
+        if self._throttled():
+            return
+        parts = [part for part in self.path.split("/") if part]
+        if parts and parts[-1] == "documents":
+            self._send_json(200, {"documents": [{"id": "DOC-1", "name": "contrato.pdf", "content": SIGNED_CONTENT}]})
+            return
+        envelope_id = parts[-1] if parts else ""
+        created_at = envelopes.get(envelope_id, time.time())
+        signed = time.time() - created_at >= SIGNED_AFTER_SECONDS
+        if self.path.startswith("/restapi/"):
+            self._send_json(200, {"envelopeId": envelope_id, "status": "completed" if signed else "sent"})
+        else:
+            self._send_json(200, {"envelope_id": envelope_id, "status": "completed" if signed else "pending"})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _simulate_latency(self):
+        jitter = random.randint(-LATENCY_JITTER_MS, LATENCY_JITTER_MS) if LATENCY_JITTER_MS else 0
+        time.sleep(max(0, LATENCY_MS + jitter) / 1000)
+
+    def _throttled(self):
+        if random.random() >= THROTTLE_RATIO:
+            return False
+        self._send_json(429, {"error": "rate limit exceeded"})
+        return True
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+if __name__ == "__main__":
+    print(f"Provider stub on :{PORT} (latency={LATENCY_MS}ms +/- {LATENCY_JITTER_MS}ms, throttle={THROTTLE_RATIO})")
+    ThreadingHTTPServer(("0.0.0.0", PORT), ProviderStubHandler).serve_forever()
+""",
+
+    "load-test/k6/create-events.js": """import http from 'k6/http';
+import { check, sleep } from 'k6';
+import { Counter, Trend } from 'k6/metrics';
+import encoding from 'k6/encoding';
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:8080';
+const PROVIDER = __ENV.PROVIDER || 'CERTISIGN';
+const UNIQUE_DOCUMENTS = __ENV.UNIQUE_DOCUMENTS === 'true';
+const DOCUMENT_SIZE = parseInt(__ENV.DOCUMENT_SIZE || '65536');
+const DURATION = __ENV.DURATION || '2m';
+const LAG_VUS = parseInt(__ENV.LAG_VUS || '2');
+const LAG_TIMEOUT_MS = parseInt(__ENV.LAG_TIMEOUT_MS || '120000');
+const HEADERS = {
+    'Content-Type': 'application/json',
+    Authorization: `Basic ${encoding.b64encode(`${__ENV.APP_USER || 'loadtest'}:${__ENV.APP_PASSWORD || 'loadtest'}`)}`,
+};
+const SHARED_DOCUMENT = '%PDF-1.4 contrato ' + 'x'.repeat(DOCUMENT_SIZE);
+
+const eventsCreated = new Counter('events_created');
+const createDuration = new Trend('create_duration', true);
+const taskLag = new Trend('task_lag', true);
+const taskLagTimeouts = new Counter('task_lag_timeouts');
+const sweepDuration = new Trend('sweep_duration', true);
+const taskDeliveryLag = new Trend('task_delivery_lag', true);
+
+export const options = {
+    scenarios: {
+        create: {
+            executor: 'constant-arrival-rate',
+            exec: 'createEvents',
+            rate: parseInt(__ENV.RATE || '50'),
+            timeUnit: '1s',
+            duration: DURATION,
+            preAllocatedVUs: 50,
+            maxVUs: 500,
+        },
+        task_lag: {
+            executor: 'constant-vus',
+            exec: 'measureTaskLag',
+            vus: LAG_VUS,
+            duration: DURATION,
+        },
+    },
+    thresholds: {
+        'http_req_failed{name:create}': ['rate<0.01'],
+    },
+};
+
+function createEvent(tag) {
+    const content = UNIQUE_DOCUMENTS ? `${SHARED_DOCUMENT}-${__VU}-${__ITER}` : SHARED_DOCUMENT;
+    const payload = JSON.stringify({
+        campaignId: 'CAMP-LOADTEST',
+        cnpj: String(10000000000000 + __VU * 100000 + __ITER).slice(-14),
+        provider: PROVIDER,
+        documents: [{ fileName: 'contrato.pdf', base64Content: encoding.b64encode(content) }],
+        signerName: 'Load Test',
+        signerEmail: 'loadtest@example.com',
+    });
+
+    const response = http.post(`${BASE_URL}/api/assinaturas/eventos`, payload, {
+        headers: HEADERS,
+        tags: { name: tag },
+    });
+    return check(response, { 'event created': (r) => r.status === 201 }) ? response : null;
+}
+
+export function createEvents() {
+    const response = createEvent('create');
+    if (response) {
+        eventsCreated.add(1);
+        createDuration.add(response.timings.duration);
+    }
+}
+
+export function measureTaskLag() {
+    const response = createEvent('lag_create');
+    if (!response) {
+        return;
+    }
+    const eventId = response.json('id');
+    const createdAt = Date.now();
+    while (Date.now() - createdAt < LAG_TIMEOUT_MS) {
+        const poll = http.get(`${BASE_URL}/api/assinaturas/eventos/${eventId}`, {
+            headers: HEADERS,
+            tags: { name: 'poll' },
+        });
+        if (poll.status === 200 && poll.json('status') !== 'PENDING') {
+            taskLag.add(Date.now() - createdAt);
+            return;
+        }
+        sleep(0.25);
+    }
+    taskLagTimeouts.add(1);
+}
+
+// Média (ms) de um Timer do Micrometer por valor de tag, a partir do formato Prometheus
+function averagesByTag(body, metric, tag) {
+    const pattern = new RegExp(`^${metric}_seconds_(sum|count)\\\\{.*${tag}="([^"]+)".*\\\\} ([0-9.eE+-]+)$`);
+    const sums = {};
+    const counts = {};
+    for (const line of body.split('\\n')) {
+        const match = line.match(pattern);
+        if (!match) {
+            continue;
+        }
+        const target = match[1] === 'sum' ? sums : counts;
+        target[match[2]] = (target[match[2]] || 0) + parseFloat(match[3]);
+    }
+    const averages = {};
+    for (const key of Object.keys(sums)) {
+        if (counts[key] > 0) {
+            averages[key] = (sums[key] / counts[key]) * 1000;
+        }
+    }
+    return averages;
+}
+
+export function teardown() {
+    const response = http.get(`${BASE_URL}/actuator/prometheus`, { headers: HEADERS, tags: { name: 'metrics' } });
+    if (response.status !== 200) {
+        return;
+    }
+    for (const [sweep, avg] of Object.entries(averagesByTag(response.body, 'signature_sweep_duration', 'sweep'))) {
+        sweepDuration.add(avg, { sweep });
+    }
+    for (const [queue, avg] of Object.entries(averagesByTag(response.body, 'signature_tasks_lag', 'queue'))) {
+        taskDeliveryLag.add(avg, { queue });
+    }
+}
+
+export function handleSummary(data) {
+    const metrics = data.metrics;
+    const trend = (name) => (metrics[name] ? `avg ${metrics[name].values.avg.toFixed(0)}ms, p95 ${metrics[name].values['p(95)'].toFixed(0)}ms` : 'n/a');
+    const lines = [
+        `create RPS:     ${metrics.events_created ? metrics.events_created.values.rate.toFixed(1) : 'n/a'}`,
+        `create latency: ${trend('create_duration')}`,
+        `task lag:       ${trend('task_lag')} (timeouts: ${metrics.task_lag_timeouts ? metrics.task_lag_timeouts.values.count : 0})`,
+        `task delivery:  ${trend('task_delivery_lag')}`,
+        `sweep duration: ${trend('sweep_duration')}`,
+    ];
+    return {
+        stdout: lines.join('\\n') + '\\n',
+        '/scripts/summary.json': JSON.stringify(data, null, 2),
+    };
+}
+""",
+
+    "load-test/README.md": """# Load Test
+
+Stack local para medir throughput ponta a ponta do serviço:
+
+- **postgres**: banco da aplicação
+- **fake-gcs**: fake-gcs-server com o bucket `signature-loadtest`
+- **cloud-tasks**: emulador de Cloud Tasks que chama de volta `/api/internal/assinaturas/tasks/*`
+- **provider-stub**: stub de Certisign/DocuSign com latência configurável
+- **app**: serviço buildado com `docker/Dockerfile.fast-startup`
+- **k6**: script `k6/create-events.js`
+
+## Executar
+
+```bash
+cd load-test
+docker compose up -d --build
+RATE=100 DURATION=5m docker compose --profile run run --rm k6
+```
+
+## Parâmetros
+
+| Variável | Padrão | Descrição |
+|---|---|---|
+| `RATE` | 50 | Criações por segundo |
+| `DURATION` | 2m | Duração do teste |
+| `PROVIDER` | CERTISIGN | Provider dos eventos |
+| `LAG_VUS` | 2 | VUs do cenário que mede o task lag |
+| `SWEEP_CRON` | `*/30 * * * * *` | Cron das varreduras agendadas durante o teste (check status, expiração, upload) |
+| `UNIQUE_DOCUMENTS` | false | Documento diferente por evento (desativa a deduplicação no GCS) |
+| `PROVIDER_LATENCY_MS` | 300 | Latência média do stub |
+| `PROVIDER_LATENCY_JITTER_MS` | 100 | Variação da latência do stub |
+| `PROVIDER_THROTTLE_RATIO` | 0 | Fração de respostas 429 do stub |
+| `PROVIDER_SIGNED_AFTER_SECONDS` | 30 | Tempo até o envelope aparecer como assinado |
+
+## Resultado
+
+- **create RPS**: eventos criados por segundo
+- **task lag**: tempo entre a criação e o evento sair de `PENDING`, medido num cenário separado (`LAG_VUS`) para não afetar a taxa de criação
+- **task delivery**: média de `signature.tasks.lag` (ETA da task → chegada no handler) lida de `/actuator/prometheus` ao final
+- **sweep duration**: média de `signature.sweep.duration` lida de `/actuator/prometheus` ao final; `SWEEP_CRON` faz as varreduras rodarem durante o teste
+
+As tasks chamam a aplicação com o Basic Auth de `SPRING_SECURITY_USER_*` (`app.internal.username`/`password`).
+Enquanto não houver clients de Certisign/DocuSign (`SignatureProvider`), o envio falha e o evento só sai de `PENDING` como `ERROR` na última tentativa; nesse caso use **task delivery** como medida de atraso da fila.
+
+O resumo completo fica em `k6/summary.json`.
+""",
+
+    "load-test/fake-gcs-data/signature-loadtest/.keep": """""",
+
     # Migration
     "src/main/resources/db/migration/V1__create_signature_events_table.sql": """CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
@@ -260,9 +953,20 @@ enum class SignatureStatus {
 
     "src/main/kotlin/com/yourcompany/signature/domain/enums/SignatureProvider.kt": """package com.yourcompany.signature.domain.enums
 
+import java.util.*
+
 enum class SignatureProvider {
     CERTISIGN,
-    DOCUSIGN
+    DOCUSIGN;
+
+    companion object {
+        private val byCode: Map<String, SignatureProvider> =
+            Collections.unmodifiableMap(TreeMap<String, SignatureProvider>(String.CASE_INSENSITIVE_ORDER).apply {
+                SignatureProvider.values().forEach { put(it.name, it) }
+            })
+
+        fun fromCode(code: String): SignatureProvider? = byCode[code]
+    }
 }
 """,
 
@@ -349,12 +1053,12 @@ interface SignatureEventRepository : JpaRepository<SignatureEvent, UUID> {
     fun findByStatus(status: SignatureStatus, pageable: Pageable): Page<SignatureEvent>
 
     @Query(
-        '''
+        \"\"\"
         SELECT se FROM SignatureEvent se 
         WHERE se.status IN :statuses 
         AND se.metadata ? 'envelope_id'
         ORDER BY se.updatedAt ASC
-        '''
+        \"\"\"
     )
     fun findByStatusInForStatusCheck(
         statuses: List<SignatureStatus>,
@@ -382,6 +1086,7 @@ data class CreateSignatureEventRequest(
     val cnpj: String,
 
     @field:NotBlank
+    @field:SupportedProvider
     val provider: String,
 
     @field:NotEmpty
@@ -396,7 +1101,7 @@ data class CreateSignatureEventRequest(
         val event = SignatureEvent(
             campaignId = campaignId,
             cnpj = cnpj,
-            provider = SignatureProvider.valueOf(provider.uppercase()),
+            provider = requireNotNull(SignatureProvider.fromCode(provider)) { "Unsupported provider: $provider" },
             status = SignatureStatus.PENDING
         )
         event.metadata["documents"] = documents.map { it.toMap() }
@@ -416,6 +1121,31 @@ data class DocumentData(
 ) {
     fun toMap() = mapOf("fileName" to fileName)
 }
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/dto/request/SupportedProvider.kt": """package com.yourcompany.signature.dto.request
+
+import com.yourcompany.signature.domain.enums.SignatureProvider
+import jakarta.validation.Constraint
+import jakarta.validation.ConstraintValidator
+import jakarta.validation.ConstraintValidatorContext
+import jakarta.validation.Payload
+import kotlin.reflect.KClass
+
+@Target(AnnotationTarget.FIELD)
+@Retention(AnnotationRetention.RUNTIME)
+@Constraint(validatedBy = [SupportedProviderValidator::class])
+annotation class SupportedProvider(
+    val message: String = "provider não suportado",
+    val groups: Array<KClass<*>> = [],
+    val payload: Array<KClass<out Payload>> = []
+)
+
+class SupportedProviderValidator : ConstraintValidator<SupportedProvider, String> {
+    // null/vazio fica a cargo de @NotBlank
+    override fun isValid(value: String?, context: ConstraintValidatorContext): Boolean =
+        value.isNullOrBlank() || SignatureProvider.fromCode(value) != null
+}
 """,
 
     "src/main/kotlin/com/yourcompany/signature/dto/response/SignatureEventResponse.kt": """package com.yourcompany.signature.dto.response
@@ -449,18 +1179,160 @@ data class StatusCheckResponse(
     val signedAt: String?,
     val rawResponse: Map<String, Any>
 )
+""",
+
+    # Config
+    "src/main/kotlin/com/yourcompany/signature/config/ProviderResilienceProperties.kt": """package com.yourcompany.signature.config
+
+import com.yourcompany.signature.domain.enums.SignatureProvider
+import org.springframework.boot.context.properties.ConfigurationProperties
+import java.time.Duration
+
+@ConfigurationProperties(prefix = "signature.resilience")
+data class ProviderResilienceProperties(
+    val providers: Map<String, Limits> = emptyMap()
+) {
+    fun forProvider(providerType: SignatureProvider): Limits =
+        providers[providerType.name.lowercase()] ?: Limits()
+
+    data class Limits(
+        val requestsPerSecond: Double = 10.0,
+        val burst: Int = 10,
+        val acquireTimeout: Duration = Duration.ofSeconds(2),
+        val initialConcurrency: Int = 4,
+        val minConcurrency: Int = 1,
+        val maxConcurrency: Int = 20,
+        val latencyThreshold: Duration = Duration.ofSeconds(5),
+        val backoffRatio: Double = 0.7
+    )
+}
+""",
+
+    # Metrics
+    "src/main/kotlin/com/yourcompany/signature/metrics/SignatureMetrics.kt": """package com.yourcompany.signature.metrics
+
+import com.yourcompany.signature.domain.enums.SignatureProvider
+import com.yourcompany.signature.domain.enums.SignatureStatus
+import io.micrometer.common.KeyValues
+import io.micrometer.core.instrument.DistributionSummary
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.observation.Observation
+import io.micrometer.observation.ObservationRegistry
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+
+@Component
+class SignatureMetrics(
+    private val registry: MeterRegistry,
+    private val observationRegistry: ObservationRegistry
+) {
+    fun <T> recordProviderCall(provider: SignatureProvider, operation: String, block: () -> T): T =
+        observe(
+            "signature.provider.call",
+            KeyValues.of("provider", provider.name.lowercase(), "operation", operation),
+            block = block
+        )
+
+    fun <T> recordStorage(operation: String, block: () -> T): T =
+        observe("signature.storage.duration", KeyValues.of("operation", operation), block = block)
+
+    fun <T> recordTaskEnqueue(queueName: String, eventId: String?, block: () -> T): T =
+        observe(
+            "signature.tasks.enqueue",
+            KeyValues.of("queue", queueName),
+            eventId?.let { KeyValues.of("signature.event.id", it) } ?: KeyValues.empty(),
+            block
+        )
+
+    fun <T> recordQuery(name: String, block: () -> T): T =
+        observe("signature.repository.query", KeyValues.of("query", name), block = block)
+
+    fun <T> recordSweep(name: String, block: () -> T): T =
+        observe("signature.sweep.duration", KeyValues.of("sweep", name), block = block)
+
+    fun recordStorageBytes(operation: String, bytes: Long) {
+        DistributionSummary.builder("signature.storage.bytes")
+            .baseUnit("bytes")
+            .tags("operation", operation)
+            .register(registry)
+            .record(bytes.toDouble())
+    }
+
+    fun recordStatusTransition(provider: SignatureProvider, from: SignatureStatus, to: SignatureStatus) {
+        val counter = registry.counter(
+            "signature.status.transitions",
+            "provider", provider.name.lowercase(),
+            "from", from.name,
+            "to", to.name
+        )
+        if (!TransactionSynchronizationManager.isSynchronizationActive()) {
+            counter.increment()
+            return
+        }
+        TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+            override fun afterCommit() {
+                counter.increment()
+            }
+        })
+    }
+
+    fun recordTaskLag(queueName: String, lag: Duration) {
+        registry.timer("signature.tasks.lag", "queue", queueName).record(lag)
+    }
+
+    fun recordProviderRejection(provider: SignatureProvider, reason: String) {
+        registry.counter("signature.provider.rejected", "provider", provider.name.lowercase(), "reason", reason).increment()
+    }
+
+    fun recordUnknownProviderStatus(provider: SignatureProvider) {
+        registry.counter("signature.provider.status.unknown", "provider", provider.name.lowercase()).increment()
+    }
+
+    fun registerConcurrencyLimit(provider: SignatureProvider, limit: () -> Int) {
+        Gauge.builder("signature.provider.concurrency.limit") { limit() }
+            .tags("provider", provider.name.lowercase())
+            .register(registry)
+    }
+
+    private fun <T> observe(
+        name: String,
+        lowCardinality: KeyValues,
+        highCardinality: KeyValues = KeyValues.empty(),
+        block: () -> T
+    ): T {
+        val observation = Observation.createNotStarted(name, observationRegistry)
+            .lowCardinalityKeyValues(lowCardinality)
+            .highCardinalityKeyValues(highCardinality)
+            .start()
+        try {
+            return observation.openScope().use { block() }
+        } catch (e: Exception) {
+            observation.error(e)
+            throw e
+        } finally {
+            observation.stop()
+        }
+    }
+}
 """,
 
     # GcsStorageService
     "src/main/kotlin/com/yourcompany/signature/service/GcsStorageService.kt": """package com.yourcompany.signature.service
 
+import com.fasterxml.jackson.databind.ObjectMapper
 import com.google.cloud.storage.BlobId
 import com.google.cloud.storage.BlobInfo
 import com.google.cloud.storage.Storage
+import com.google.cloud.storage.StorageException
+import com.yourcompany.signature.metrics.SignatureMetrics
 import org.slf4j.LoggerFactory
 import org.springframework.beans.factory.annotation.Value
 import org.springframework.stereotype.Service
 import java.io.ByteArrayOutputStream
+import java.security.MessageDigest
 import java.util.*
 import java.util.zip.ZipEntry
 import java.util.zip.ZipOutputStream
@@ -468,22 +1340,41 @@ import java.util.zip.ZipOutputStream
 @Service
 class GcsStorageService(
     private val storage: Storage,
-    @Value("\${gcp.storage.bucket-name}") private val bucketName: String
+    private val objectMapper: ObjectMapper,
+    private val metrics: SignatureMetrics,
+    @Value("\${gcp.storage.bucket-name}") private val bucketName: String,
+    @Value("\${gcp.storage.uploaded-hash-cache-size:10000}") private val uploadedHashCacheSize: Int
 ) {
     private val logger = LoggerFactory.getLogger(javaClass)
 
-    fun uploadDocumentsZip(
+    private val uploadedHashes: MutableMap<String, Boolean> = Collections.synchronizedMap(
+        object : LinkedHashMap<String, Boolean>(16, 0.75f, true) {
+            override fun removeEldestEntry(eldest: MutableMap.MutableEntry<String, Boolean>): Boolean =
+                size > uploadedHashCacheSize
+        }
+    )
+
+    fun uploadDocuments(
         campaignId: String,
         cnpj: String,
         eventId: UUID,
         documents: List<Map<String, String>>
     ): String {
-        val path = "$campaignId/$cnpj/$eventId/documents.zip"
-        val zipBytes = createZipFromBase64Documents(documents)
+        val entries = documents.map { doc ->
+            val fileName = doc["fileName"] ?: "document.pdf"
+            val bytes = Base64.getDecoder().decode(doc["content"] ?: "")
+            val sha256 = sha256Hex(bytes)
+            val blobPath = uploadBlobIfAbsent(sha256, bytes)
+            DocumentManifestEntry(fileName = fileName, sha256 = sha256, size = bytes.size.toLong(), blobPath = blobPath)
+        }
+
+        val path = "$campaignId/$cnpj/$eventId/documents.json"
         val blobInfo = BlobInfo.newBuilder(BlobId.of(bucketName, path))
-            .setContentType("application/zip")
+            .setContentType("application/json")
             .build()
-        storage.create(blobInfo, zipBytes)
+        metrics.recordStorage("manifest_upload") {
+            storage.create(blobInfo, objectMapper.writeValueAsBytes(DocumentManifest(eventId.toString(), entries)))
+        }
         return "gs://$bucketName/$path"
     }
 
@@ -494,14 +1385,49 @@ class GcsStorageService(
         documents: List<Map<String, String>>
     ): String {
         val path = "$campaignId/$cnpj/$eventId/signed_documents.zip"
-        val zipBytes = createZipFromBase64Documents(documents)
+        val zipBytes = metrics.recordStorage("zip_build") { createZipFromBase64Documents(documents) }
         val blobInfo = BlobInfo.newBuilder(BlobId.of(bucketName, path))
             .setContentType("application/zip")
             .build()
-        storage.create(blobInfo, zipBytes)
+        metrics.recordStorage("signed_zip_upload") { storage.create(blobInfo, zipBytes) }
+        metrics.recordStorageBytes("signed_zip_upload", zipBytes.size.toLong())
         return "gs://$bucketName/$path"
     }
 
+    fun readDocuments(manifestGcsPath: String): List<Pair<String, ByteArray>> {
+        val manifestPath = manifestGcsPath.removePrefix("gs://$bucketName/")
+        val manifest = objectMapper.readValue(
+            storage.readAllBytes(BlobId.of(bucketName, manifestPath)),
+            DocumentManifest::class.java
+        )
+        return manifest.documents.map { it.fileName to storage.readAllBytes(BlobId.of(bucketName, it.blobPath)) }
+    }
+
+    private fun uploadBlobIfAbsent(sha256: String, bytes: ByteArray): String {
+        val blobPath = "blobs/sha256/$sha256"
+        if (uploadedHashes[sha256] != null) {
+            return blobPath
+        }
+
+        val blobInfo = BlobInfo.newBuilder(BlobId.of(bucketName, blobPath))
+            .setContentType("application/octet-stream")
+            .build()
+        try {
+            metrics.recordStorage("blob_upload") {
+                storage.create(blobInfo, bytes, Storage.BlobTargetOption.doesNotExist())
+            }
+            metrics.recordStorageBytes("blob_upload", bytes.size.toLong())
+            logger.debug("Uploaded document blob {} ({} bytes)", sha256, bytes.size)
+        } catch (e: StorageException) {
+            if (e.code != 412) throw e
+        }
+        uploadedHashes[sha256] = true
+        return blobPath
+    }
+
+    private fun sha256Hex(bytes: ByteArray): String =
+        MessageDigest.getInstance("SHA-256").digest(bytes).joinToString("") { "%02x".format(it) }
+
     private fun createZipFromBase64Documents(documents: List<Map<String, String>>): ByteArray {
         val outputStream = ByteArrayOutputStream()
         ZipOutputStream(outputStream).use { zipOut ->
@@ -517,6 +1443,18 @@ class GcsStorageService(
         return outputStream.toByteArray()
     }
 }
+
+data class DocumentManifest(
+    val eventId: String,
+    val documents: List<DocumentManifestEntry>
+)
+
+data class DocumentManifestEntry(
+    val fileName: String,
+    val sha256: String,
+    val size: Long,
+    val blobPath: String
+)
 """,
 
     # CloudTasksService
@@ -526,6 +1464,9 @@ import com.fasterxml.jackson.databind.ObjectMapper
 import com.google.cloud.tasks.v2.*
 import com.google.protobuf.ByteString
 import com.google.protobuf.Timestamp
+import com.yourcompany.signature.metrics.SignatureMetrics
+import io.micrometer.tracing.Tracer
+import io.micrometer.tracing.propagation.Propagator
 import jakarta.annotation.PreDestroy
 import org.slf4j.LoggerFactory
 import org.springframework.beans.factory.annotation.Value
@@ -537,12 +1478,22 @@ import java.util.*
 class CloudTasksService(
     private val client: CloudTasksClient,
     private val objectMapper: ObjectMapper,
+    private val metrics: SignatureMetrics,
+    private val tracer: Tracer,
+    private val propagator: Propagator,
     @Value("\${gcp.project-id}") private val projectId: String,
     @Value("\${gcp.location}") private val location: String,
-    @Value("\${app.internal.url}") private val internalUrl: String
+    @Value("\${app.internal.url}") private val internalUrl: String,
+    @Value("\${app.internal.username:}") internalUsername: String,
+    @Value("\${app.internal.password:}") internalPassword: String
 ) {
     private val logger = LoggerFactory.getLogger(javaClass)
 
+    // Rotas internas exigem o mesmo Basic Auth do restante da API
+    private val authorizationHeader: String? = internalPassword.takeIf { it.isNotBlank() }?.let {
+        "Basic " + Base64.getEncoder().encodeToString("$internalUsername:$it".toByteArray())
+    }
+
     fun createSendTask(eventId: UUID, delaySeconds: Long = 0): String =
         createTask(
             queueName = "send-signature-queue",
@@ -574,27 +1525,37 @@ class CloudTasksService(
         delaySeconds: Long
     ): String {
         val queuePath = QueueName.of(projectId, location, queueName).toString()
-        val httpRequest = HttpRequest.newBuilder()
-            .setUrl(endpoint)
-            .setHttpMethod(HttpMethod.POST)
-            .putHeaders("Content-Type", "application/json")
-            .setBody(ByteString.copyFromUtf8(objectMapper.writeValueAsString(payload)))
-            .build()
-
-        val task = Task.newBuilder()
-            .setHttpRequest(httpRequest)
-            .setScheduleTime(
-                Timestamp.newBuilder()
-                    .setSeconds(Instant.now().epochSecond + delaySeconds)
-                    .build()
-            )
-            .build()
-
-        val createdTask = client.createTask(queuePath, task)
+        val createdTask = metrics.recordTaskEnqueue(queueName, payload["eventId"]?.toString()) {
+            val httpRequest = HttpRequest.newBuilder()
+                .setUrl(endpoint)
+                .setHttpMethod(HttpMethod.POST)
+                .putHeaders("Content-Type", "application/json")
+                .setBody(ByteString.copyFromUtf8(objectMapper.writeValueAsString(payload)))
+            authorizationHeader?.let { httpRequest.putHeaders("Authorization", it) }
+            injectTraceContext(httpRequest)
+
+            val task = Task.newBuilder()
+                .setHttpRequest(httpRequest.build())
+                .setScheduleTime(
+                    Timestamp.newBuilder()
+                        .setSeconds(Instant.now().epochSecond + delaySeconds)
+                        .build()
+                )
+                .build()
+
+            client.createTask(queuePath, task)
+        }
         logger.info("Created task {}", createdTask.name)
         return createdTask.name
     }
 
+    private fun injectTraceContext(httpRequest: HttpRequest.Builder) {
+        val context = tracer.currentTraceContext().context() ?: return
+        propagator.inject(context, httpRequest) { carrier, key, value ->
+            carrier?.putHeaders(key, value)
+        }
+    }
+
     @PreDestroy
     fun close() {
         client.close()
@@ -610,11 +1571,14 @@ import com.yourcompany.signature.domain.enums.SignatureStatus
 import com.yourcompany.signature.domain.repository.SignatureEventRepository
 import com.yourcompany.signature.dto.request.CreateSignatureEventRequest
 import com.yourcompany.signature.dto.response.SignatureEventResponse
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.provider.ProviderStatusMapping
 import com.yourcompany.signature.service.provider.SignatureProviderFactory
 import org.slf4j.LoggerFactory
 import org.springframework.data.domain.Pageable
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
+import org.springframework.transaction.support.TransactionTemplate
 import java.time.LocalDateTime
 import java.util.*
 
@@ -622,7 +1586,9 @@ import java.util.*
 class SignatureEventService(
     private val repository: SignatureEventRepository,
     private val providerFactory: SignatureProviderFactory,
-    private val gcsStorageService: GcsStorageService
+    private val gcsStorageService: GcsStorageService,
+    private val metrics: SignatureMetrics,
+    private val transactionTemplate: TransactionTemplate
 ) {
     private val logger = LoggerFactory.getLogger(javaClass)
 
@@ -635,7 +1601,7 @@ class SignatureEventService(
             mapOf("fileName" to it.fileName, "content" to it.base64Content)
         }
 
-        val gcsPath = gcsStorageService.uploadDocumentsZip(
+        val gcsPath = gcsStorageService.uploadDocuments(
             campaignId = saved.campaignId,
             cnpj = saved.cnpj,
             eventId = saved.id!!,
@@ -653,6 +1619,7 @@ class SignatureEventService(
         val provider = providerFactory.getProvider(event.provider)
         val response = provider.sendEnvelope(event)
         event.setEnvelopeId(response.envelopeId)
+        metrics.recordStatusTransition(event.provider, event.status, SignatureStatus.SENT)
         event.status = SignatureStatus.SENT
         event.metadata["sent_at"] = LocalDateTime.now().toString()
         return repository.save(event)
@@ -661,6 +1628,7 @@ class SignatureEventService(
     @Transactional
     fun markAsError(eventId: UUID, errorMessage: String?) {
         val event = repository.findById(eventId).orElseThrow()
+        metrics.recordStatusTransition(event.provider, event.status, SignatureStatus.ERROR)
         event.status = SignatureStatus.ERROR
         event.metadata["error_message"] = errorMessage ?: "Unknown error"
         event.metadata["error_at"] = LocalDateTime.now().toString()
@@ -673,13 +1641,15 @@ class SignatureEventService(
         val provider = providerFactory.getProvider(event.provider)
         val statusResponse = provider.checkStatus(envelopeId)
 
-        val newStatus = when (statusResponse.status) {
-            "SIGNED" -> SignatureStatus.SIGNED
-            "REJECTED" -> SignatureStatus.REJECTED
-            else -> SignatureStatus.SENT
+        val newStatus = ProviderStatusMapping.resolve(event.provider, statusResponse.status)
+        if (newStatus == null) {
+            metrics.recordUnknownProviderStatus(event.provider)
+            logger.warn("Unknown {} status '{}' for envelope {}", event.provider, statusResponse.status, envelopeId)
+            return
         }
 
         if (newStatus != event.status) {
+            metrics.recordStatusTransition(event.provider, event.status, newStatus)
             event.status = newStatus
             if (newStatus == SignatureStatus.SIGNED) {
                 event.metadata["signed_at"] = LocalDateTime.now().toString()
@@ -688,13 +1658,18 @@ class SignatureEventService(
         }
     }
 
-    @Transactional
-    fun markExpiredEvents(): Int {
+    // A transação abre dentro da medição para que o flush dos UPDATEs no commit entre na duração da varredura
+    fun markExpiredEvents(): Int = metrics.recordSweep("mark_expired") {
+        transactionTemplate.execute { expireSentEvents() }!!
+    }
+
+    private fun expireSentEvents(): Int {
         val thirtyDaysAgo = LocalDateTime.now().minusDays(30)
         val expiredEvents = repository.findAll().filter {
             it.status == SignatureStatus.SENT && it.createdAt.isBefore(thirtyDaysAgo)
         }
         expiredEvents.forEach { event ->
+            metrics.recordStatusTransition(event.provider, event.status, SignatureStatus.EXPIRED)
             event.status = SignatureStatus.EXPIRED
             event.metadata["expired_at"] = LocalDateTime.now().toString()
             event.metadata["expiration_reason"] = "30 days without signature"
@@ -721,12 +1696,14 @@ class SignatureEventService(
         )
 
         event.metadata["signed_documents_gcs_path"] = gcsPath
+        metrics.recordStatusTransition(event.provider, event.status, SignatureStatus.UPLOADED)
         event.status = SignatureStatus.UPLOADED
         return repository.save(event)
     }
 
-    fun findSentEventsForStatusCheck(pageable: Pageable) =
+    fun findSentEventsForStatusCheck(pageable: Pageable) = metrics.recordQuery("find_sent_for_status_check") {
         repository.findByStatusInForStatusCheck(listOf(SignatureStatus.SENT), pageable)
+    }
 
     fun findSignedEvents(pageable: Pageable) =
         repository.findByStatus(SignatureStatus.SIGNED, pageable)
@@ -772,15 +1749,32 @@ data class SignedDocumentData(
 
     "src/main/kotlin/com/yourcompany/signature/service/provider/SignatureProviderFactory.kt": """package com.yourcompany.signature.service.provider
 
+import com.yourcompany.signature.config.ProviderResilienceProperties
 import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.provider.resilience.ResilientSignatureProvider
+import io.github.resilience4j.circuitbreaker.CircuitBreakerRegistry
 import org.springframework.stereotype.Component
 
 @Component
 class SignatureProviderFactory(
-    private val providers: List<SignatureProvider>
+    private val providers: List<SignatureProvider>,
+    private val resilienceProperties: ProviderResilienceProperties,
+    private val circuitBreakerRegistry: CircuitBreakerRegistry,
+    private val metrics: SignatureMetrics
 ) {
     private val providerMap: Map<ProviderType, SignatureProvider> =
-        providers.associateBy { it.getProviderType() }
+        providers.associate { provider ->
+            val providerType = provider.getProviderType()
+            val resilient = ResilientSignatureProvider(
+                delegate = provider,
+                limits = resilienceProperties.forProvider(providerType),
+                circuitBreaker = circuitBreakerRegistry.circuitBreaker(providerType.name.lowercase()),
+                metrics = metrics
+            )
+            metrics.registerConcurrencyLimit(providerType) { resilient.concurrencyLimiter.currentLimit }
+            providerType to resilient
+        }
 
     fun getProvider(providerType: ProviderType): SignatureProvider {
         return providerMap[providerType]
@@ -789,67 +1783,1391 @@ class SignatureProviderFactory(
 }
 """,
 
-    # Controllers placeholders mínimos (você pode evoluir depois)
-    "src/main/kotlin/com/yourcompany/signature/controller/SignatureEventController.kt": """package com.yourcompany.signature.controller
+    "src/main/kotlin/com/yourcompany/signature/service/provider/ProviderExceptions.kt": """package com.yourcompany.signature.service.provider
 
-import com.yourcompany.signature.dto.request.CreateSignatureEventRequest
-import com.yourcompany.signature.dto.response.SignatureEventResponse
-import com.yourcompany.signature.service.CloudTasksService
-import com.yourcompany.signature.service.SignatureEventService
-import jakarta.validation.Valid
-import org.slf4j.LoggerFactory
-import org.springframework.data.domain.Page
-import org.springframework.data.domain.Pageable
-import org.springframework.data.web.PageableDefault
-import org.springframework.http.HttpStatus
-import org.springframework.http.ResponseEntity
-import org.springframework.web.bind.annotation.*
-import java.util.*
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
 
-@RestController
-@RequestMapping("/api/assinaturas/eventos")
-class SignatureEventController(
-    private val signatureEventService: SignatureEventService,
-    private val cloudTasksService: CloudTasksService
-) {
-    private val logger = LoggerFactory.getLogger(javaClass)
+class ProviderRateLimitedException(
+    val providerType: ProviderType,
+    message: String? = null,
+    cause: Throwable? = null
+) : RuntimeException(message ?: "Provider $providerType throttled the request", cause)
 
-    @PostMapping
-    fun createEvent(
-        @Valid @RequestBody request: CreateSignatureEventRequest
-    ): ResponseEntity<SignatureEventResponse> {
-        val response = signatureEventService.createSignatureEvent(request)
-        cloudTasksService.createSendTask(response.id)
-        return ResponseEntity.status(HttpStatus.CREATED).body(response)
-    }
+class ProviderSaturatedException(
+    val providerType: ProviderType,
+    reason: String
+) : RuntimeException("Provider $providerType saturated: $reason")
+""",
 
-    @GetMapping("/{id}")
-    fun getEvent(@PathVariable id: UUID): ResponseEntity<SignatureEventResponse> {
-        val event = signatureEventService.findById(id) ?: return ResponseEntity.notFound().build()
-        val response = SignatureEventResponse(
-            id = event.id!!,
-            campaignId = event.campaignId,
-            cnpj = event.cnpj,
-            provider = event.provider,
-            status = event.status,
-            envelopeId = event.getEnvelopeId(),
-            documentsGcsPath = event.metadata["documents_gcs_path"] as? String,
-            signedDocumentsGcsPath = event.metadata["signed_documents_gcs_path"] as? String,
-            createdAt = event.createdAt,
-            updatedAt = event.updatedAt
-        )
-        return ResponseEntity.ok(response)
-    }
+    "src/main/kotlin/com/yourcompany/signature/service/provider/ProviderStatusMapping.kt": """package com.yourcompany.signature.service.provider
 
-    @GetMapping
-    fun listEvents(
-        @PageableDefault(size = 50) pageable: Pageable
-    ): ResponseEntity<Page<SignatureEventResponse>> {
-        // Para estudo: você pode implementar listagem com filtros aqui
-        return ResponseEntity.ok(Page.empty())
-    }
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import com.yourcompany.signature.domain.enums.SignatureStatus
+import java.util.*
+
+object ProviderStatusMapping {
+    private val mappings: Map<ProviderType, Map<String, SignatureStatus>> =
+        Collections.unmodifiableMap(EnumMap<ProviderType, Map<String, SignatureStatus>>(ProviderType::class.java).apply {
+            put(
+                ProviderType.CERTISIGN,
+                caseInsensitive(
+                    "COMPLETED" to SignatureStatus.SIGNED,
+                    "SIGNED" to SignatureStatus.SIGNED,
+                    "REJECTED" to SignatureStatus.REJECTED,
+                    "CANCELLED" to SignatureStatus.REJECTED,
+                    "PENDING" to SignatureStatus.SENT,
+                    "WAITING" to SignatureStatus.SENT
+                )
+            )
+            put(
+                ProviderType.DOCUSIGN,
+                caseInsensitive(
+                    "completed" to SignatureStatus.SIGNED,
+                    "declined" to SignatureStatus.REJECTED,
+                    "voided" to SignatureStatus.REJECTED,
+                    "sent" to SignatureStatus.SENT,
+                    "delivered" to SignatureStatus.SENT
+                )
+            )
+        })
+
+    fun resolve(provider: ProviderType, providerStatus: String): SignatureStatus? =
+        mappings[provider]?.get(providerStatus)
+
+    private fun caseInsensitive(vararg statuses: Pair<String, SignatureStatus>): Map<String, SignatureStatus> =
+        Collections.unmodifiableMap(TreeMap<String, SignatureStatus>(String.CASE_INSENSITIVE_ORDER).apply { putAll(statuses) })
 }
 """,
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/auth/ProviderTokenSource.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import java.time.Instant
+
+interface ProviderTokenSource {
+    fun fetchToken(): AccessToken
+    fun getProviderType(): ProviderType
+}
+
+data class AccessToken(
+    val value: String,
+    val expiresAt: Instant
+) {
+    fun isValidAt(instant: Instant): Boolean = instant.isBefore(expiresAt)
+
+    companion object {
+        fun nonExpiring(value: String) = AccessToken(value, Instant.MAX)
+    }
+}
+
+internal fun requireResolvedSecret(property: String, value: String): String {
+    check(!value.startsWith("//")) {
+        "Secret for $property was not resolved (got '$value'); enable the Secret Manager import or set the env var"
+    }
+    return value
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/auth/ProviderTokenManager.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.time.Clock
+import java.time.Duration
+import java.time.Instant
+import java.util.concurrent.ConcurrentHashMap
+
+@Component
+class ProviderTokenManager(
+    tokenSources: List<ProviderTokenSource>,
+    @Value("\${signature.auth.refresh-skew:60s}") private val refreshSkew: Duration,
+    @Value("\${signature.auth.failure-backoff:5s}") private val failureBackoff: Duration,
+    private val clock: Clock = Clock.systemUTC()
+) {
+    private val logger = LoggerFactory.getLogger(javaClass)
+
+    private val sources: Map<ProviderType, ProviderTokenSource> = tokenSources.associateBy { it.getProviderType() }
+    private val refreshLocks: Map<ProviderType, Any> = sources.keys.associateWith { Any() }
+    private val tokens = ConcurrentHashMap<ProviderType, AccessToken>()
+    private val failures = ConcurrentHashMap<ProviderType, FailedRefresh>()
+
+    fun getToken(providerType: ProviderType): String {
+        cachedToken(providerType)?.let { return it.value }
+
+        val lock = refreshLocks[providerType]
+            ?: throw IllegalArgumentException("Token source not found: $providerType")
+        synchronized(lock) {
+            cachedToken(providerType)?.let { return it.value }
+            // Falha recente: as threads que aguardavam o lock não repetem a chamada ao endpoint de autenticação
+            failures[providerType]?.takeIf { clock.instant().isBefore(it.retryAt) }?.let {
+                throw IllegalStateException("$providerType token refresh failed, retrying after ${it.retryAt}", it.cause)
+            }
+            val token = try {
+                sources.getValue(providerType).fetchToken()
+            } catch (e: Exception) {
+                failures[providerType] = FailedRefresh(clock.instant().plus(failureBackoff), e)
+                throw e
+            }
+            failures.remove(providerType)
+            tokens[providerType] = token
+            logger.debug("Refreshed {} access token, expires at {}", providerType, token.expiresAt)
+            return token.value
+        }
+    }
+
+    fun invalidate(providerType: ProviderType) {
+        tokens.remove(providerType)
+    }
+
+    private fun cachedToken(providerType: ProviderType): AccessToken? =
+        tokens[providerType]?.takeIf { it.isValidAt(clock.instant().plus(refreshSkew)) }
+
+    private class FailedRefresh(val retryAt: Instant, val cause: Exception)
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/auth/CertisignTokenSource.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+
+@Component
+class CertisignTokenSource(
+    @Value("\${signature.certisign.api.token}") apiToken: String
+) : ProviderTokenSource {
+    private val apiToken = requireResolvedSecret("signature.certisign.api.token", apiToken)
+
+    override fun fetchToken() = AccessToken.nonExpiring(apiToken)
+
+    override fun getProviderType() = ProviderType.CERTISIGN
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/auth/DocusignTokenSource.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.fasterxml.jackson.annotation.JsonProperty
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.core.env.Environment
+import org.springframework.http.MediaType
+import org.springframework.stereotype.Component
+import org.springframework.util.LinkedMultiValueMap
+import org.springframework.web.client.RestClient
+import java.net.URI
+import java.security.KeyFactory
+import java.security.PrivateKey
+import java.security.Signature
+import java.security.spec.PKCS8EncodedKeySpec
+import java.time.Duration
+import java.time.Instant
+import java.util.*
+
+@Component
+class DocusignTokenSource(
+    restClientBuilder: RestClient.Builder,
+    private val objectMapper: ObjectMapper,
+    private val environment: Environment,
+    @Value("\${signature.docusign.api.access-token:}") private val staticAccessToken: String,
+    @Value("\${signature.docusign.auth.base-url}") private val authBaseUrl: String,
+    @Value("\${signature.docusign.auth.integration-key:}") private val integrationKey: String,
+    @Value("\${signature.docusign.auth.user-id:}") private val userId: String,
+    @Value("\${signature.docusign.auth.token-lifetime:3600s}") private val tokenLifetime: Duration
+) : ProviderTokenSource {
+    private val restClient = restClientBuilder.baseUrl(authBaseUrl).build()
+
+    init {
+        check(integrationKey.isNotBlank() || staticAccessToken.isNotBlank()) {
+            "Set signature.docusign.auth.integration-key (JWT grant) or signature.docusign.api.access-token"
+        }
+    }
+
+    private val privateKey: PrivateKey by lazy {
+        val property = "signature.docusign.auth.private-key"
+        parsePrivateKey(requireResolvedSecret(property, environment.getRequiredProperty(property)))
+    }
+
+    override fun fetchToken(): AccessToken {
+        if (integrationKey.isBlank()) {
+            return AccessToken.nonExpiring(staticAccessToken)
+        }
+
+        val form = LinkedMultiValueMap<String, String>()
+        form.add("grant_type", JWT_BEARER_GRANT_TYPE)
+        form.add("assertion", buildAssertion())
+
+        val response = restClient.post()
+            .uri("/oauth/token")
+            .contentType(MediaType.APPLICATION_FORM_URLENCODED)
+            .body(form)
+            .retrieve()
+            .body(TokenResponse::class.java)
+            ?: throw IllegalStateException("Empty DocuSign token response")
+
+        return AccessToken(response.accessToken, Instant.now().plusSeconds(response.expiresIn))
+    }
+
+    override fun getProviderType() = ProviderType.DOCUSIGN
+
+    private fun buildAssertion(): String {
+        val now = Instant.now()
+        val header = mapOf("alg" to "RS256", "typ" to "JWT")
+        val claims = mapOf(
+            "iss" to integrationKey,
+            "sub" to userId,
+            "aud" to URI(authBaseUrl).host,
+            "iat" to now.epochSecond,
+            "exp" to now.plus(tokenLifetime).epochSecond,
+            "scope" to "signature impersonation"
+        )
+        val signingInput = base64Url(objectMapper.writeValueAsBytes(header)) + "." +
+            base64Url(objectMapper.writeValueAsBytes(claims))
+
+        val signature = Signature.getInstance("SHA256withRSA")
+        signature.initSign(privateKey)
+        signature.update(signingInput.toByteArray())
+        return signingInput + "." + base64Url(signature.sign())
+    }
+
+    private fun parsePrivateKey(pem: String): PrivateKey {
+        val der = pem.lineSequence()
+            .filterNot { it.startsWith("-----") }
+            .joinToString("")
+            .filterNot { it.isWhitespace() }
+        return KeyFactory.getInstance("RSA").generatePrivate(PKCS8EncodedKeySpec(Base64.getDecoder().decode(der)))
+    }
+
+    private fun base64Url(bytes: ByteArray): String =
+        Base64.getUrlEncoder().withoutPadding().encodeToString(bytes)
+
+    private data class TokenResponse(
+        @JsonProperty("access_token") val accessToken: String,
+        @JsonProperty("expires_in") val expiresIn: Long
+    )
+
+    companion object {
+        private const val JWT_BEARER_GRANT_TYPE = "urn:ietf:params:oauth:grant-type:jwt-bearer"
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/resilience/TokenBucket.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import java.time.Duration
+import java.util.concurrent.TimeUnit
+
+class TokenBucket(
+    private val ratePerSecond: Double,
+    private val capacity: Int,
+    private val nanoTime: () -> Long = System::nanoTime
+) {
+    private var tokens = capacity.toDouble()
+    private var lastRefillNanos = nanoTime()
+
+    fun tryAcquire(timeout: Duration): Boolean {
+        val deadline = nanoTime() + timeout.toNanos()
+        while (true) {
+            val waitNanos = synchronized(this) {
+                refill()
+                if (tokens >= 1.0) {
+                    tokens -= 1.0
+                    return true
+                }
+                ((1.0 - tokens) / ratePerSecond * 1_000_000_000).toLong()
+            }
+            if (nanoTime() + waitNanos > deadline) {
+                return false
+            }
+            TimeUnit.NANOSECONDS.sleep(waitNanos)
+        }
+    }
+
+    fun refund() {
+        synchronized(this) {
+            tokens = minOf(capacity.toDouble(), tokens + 1.0)
+        }
+    }
+
+    private fun refill() {
+        val now = nanoTime()
+        tokens = minOf(capacity.toDouble(), tokens + (now - lastRefillNanos) / 1_000_000_000.0 * ratePerSecond)
+        lastRefillNanos = now
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/resilience/AdaptiveConcurrencyLimiter.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import java.time.Duration
+
+class AdaptiveConcurrencyLimiter(
+    initialLimit: Int,
+    private val minLimit: Int,
+    private val maxLimit: Int,
+    latencyThreshold: Duration,
+    private val backoffRatio: Double,
+    private val nanoTime: () -> Long = System::nanoTime
+) {
+    private val latencyThresholdNanos = latencyThreshold.toNanos()
+    private var limit = initialLimit.coerceIn(minLimit, maxLimit).toDouble()
+    private var lastDecreaseNanos: Long? = null
+
+    var inFlight = 0
+        @Synchronized get
+        private set
+
+    val currentLimit: Int
+        @Synchronized get() = limit.toInt()
+
+    @Synchronized
+    fun tryAcquire(): Boolean {
+        if (inFlight >= limit.toInt()) {
+            return false
+        }
+        inFlight++
+        return true
+    }
+
+    @Synchronized
+    fun onSuccess(latencyNanos: Long) {
+        // Só cresce com o limite em uso; ociosidade não deve levar o limite até maxLimit
+        val nearLimit = inFlight * 2 >= limit
+        inFlight--
+        if (latencyNanos > latencyThresholdNanos) {
+            decrease()
+        } else if (nearLimit) {
+            limit = minOf(maxLimit.toDouble(), limit + 1.0 / limit)
+        }
+    }
+
+    @Synchronized
+    fun onDropped() {
+        inFlight--
+        decrease()
+    }
+
+    @Synchronized
+    fun onIgnored() {
+        inFlight--
+    }
+
+    private fun decrease() {
+        val now = nanoTime()
+        val last = lastDecreaseNanos
+        if (last != null && now - last < latencyThresholdNanos) {
+            return
+        }
+        limit = maxOf(minLimit.toDouble(), limit * backoffRatio)
+        lastDecreaseNanos = now
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/service/provider/resilience/ResilientSignatureProvider.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import com.yourcompany.signature.config.ProviderResilienceProperties
+import com.yourcompany.signature.domain.entity.SignatureEvent
+import com.yourcompany.signature.dto.response.ProviderResponse
+import com.yourcompany.signature.dto.response.StatusCheckResponse
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.provider.ProviderRateLimitedException
+import com.yourcompany.signature.service.provider.ProviderSaturatedException
+import com.yourcompany.signature.service.provider.SignatureProvider
+import com.yourcompany.signature.service.provider.SignedDocumentData
+import io.github.resilience4j.circuitbreaker.CallNotPermittedException
+import io.github.resilience4j.circuitbreaker.CircuitBreaker
+import org.springframework.web.client.HttpServerErrorException
+import org.springframework.web.client.ResourceAccessException
+import java.net.SocketTimeoutException
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.TimeoutException
+
+class ResilientSignatureProvider(
+    private val delegate: SignatureProvider,
+    private val limits: ProviderResilienceProperties.Limits,
+    private val circuitBreaker: CircuitBreaker,
+    private val metrics: SignatureMetrics
+) : SignatureProvider {
+    private val tokenBucket = TokenBucket(limits.requestsPerSecond, limits.burst)
+
+    val concurrencyLimiter = AdaptiveConcurrencyLimiter(
+        initialLimit = limits.initialConcurrency,
+        minLimit = limits.minConcurrency,
+        maxLimit = limits.maxConcurrency,
+        latencyThreshold = limits.latencyThreshold,
+        backoffRatio = limits.backoffRatio
+    )
+
+    override fun sendEnvelope(event: SignatureEvent): ProviderResponse =
+        call("send_envelope") { delegate.sendEnvelope(event) }
+
+    override fun checkStatus(providerEnvelopeId: String): StatusCheckResponse =
+        call("check_status") { delegate.checkStatus(providerEnvelopeId) }
+
+    override fun downloadSignedDocuments(providerEnvelopeId: String): List<SignedDocumentData> =
+        call("download_signed_documents") { delegate.downloadSignedDocuments(providerEnvelopeId) }
+
+    override fun getProviderType() = delegate.getProviderType()
+
+    private fun <T> call(operation: String, block: () -> T): T {
+        if (!circuitBreaker.tryAcquirePermission()) {
+            metrics.recordProviderRejection(getProviderType(), "circuit_open")
+            throw CallNotPermittedException.createCallNotPermittedException(circuitBreaker)
+        }
+        if (!tokenBucket.tryAcquire(limits.acquireTimeout)) {
+            circuitBreaker.releasePermission()
+            metrics.recordProviderRejection(getProviderType(), "rate_limit")
+            throw ProviderSaturatedException(getProviderType(), "no rate limit tokens within ${limits.acquireTimeout}")
+        }
+        if (!concurrencyLimiter.tryAcquire()) {
+            tokenBucket.refund()
+            circuitBreaker.releasePermission()
+            metrics.recordProviderRejection(getProviderType(), "concurrency_limit")
+            throw ProviderSaturatedException(getProviderType(), "concurrency limit ${concurrencyLimiter.currentLimit} reached")
+        }
+
+        val start = System.nanoTime()
+        try {
+            val result = metrics.recordProviderCall(getProviderType(), operation, block)
+            val elapsed = System.nanoTime() - start
+            circuitBreaker.onSuccess(elapsed, TimeUnit.NANOSECONDS)
+            concurrencyLimiter.onSuccess(elapsed)
+            return result
+        } catch (e: ProviderRateLimitedException) {
+            circuitBreaker.releasePermission()
+            concurrencyLimiter.onDropped()
+            throw e
+        } catch (e: Exception) {
+            circuitBreaker.onError(System.nanoTime() - start, TimeUnit.NANOSECONDS, e)
+            if (isOverloadSignal(e)) concurrencyLimiter.onDropped() else concurrencyLimiter.onIgnored()
+            throw e
+        }
+    }
+
+    // Timeouts e 5xx indicam provider degradado e reduzem o limite como um 429
+    private fun isOverloadSignal(e: Exception) =
+        e is HttpServerErrorException || e is ResourceAccessException ||
+            e is SocketTimeoutException || e is TimeoutException
+}
+""",
+
+    # Controllers placeholders mínimos (você pode evoluir depois)
+    "src/main/kotlin/com/yourcompany/signature/controller/SignatureEventController.kt": """package com.yourcompany.signature.controller
+
+import com.yourcompany.signature.dto.request.CreateSignatureEventRequest
+import com.yourcompany.signature.dto.response.SignatureEventResponse
+import com.yourcompany.signature.service.CloudTasksService
+import com.yourcompany.signature.service.SignatureEventService
+import jakarta.validation.Valid
+import org.slf4j.LoggerFactory
+import org.springframework.data.domain.Page
+import org.springframework.data.domain.Pageable
+import org.springframework.data.web.PageableDefault
+import org.springframework.http.HttpStatus
+import org.springframework.http.ResponseEntity
+import org.springframework.web.bind.annotation.*
+import java.util.*
+
+@RestController
+@RequestMapping("/api/assinaturas/eventos")
+class SignatureEventController(
+    private val signatureEventService: SignatureEventService,
+    private val cloudTasksService: CloudTasksService
+) {
+    private val logger = LoggerFactory.getLogger(javaClass)
+
+    @PostMapping
+    fun createEvent(
+        @Valid @RequestBody request: CreateSignatureEventRequest
+    ): ResponseEntity<SignatureEventResponse> {
+        val response = signatureEventService.createSignatureEvent(request)
+        cloudTasksService.createSendTask(response.id)
+        return ResponseEntity.status(HttpStatus.CREATED).body(response)
+    }
+
+    @GetMapping("/{id}")
+    fun getEvent(@PathVariable id: UUID): ResponseEntity<SignatureEventResponse> {
+        val event = signatureEventService.findById(id) ?: return ResponseEntity.notFound().build()
+        val response = SignatureEventResponse(
+            id = event.id!!,
+            campaignId = event.campaignId,
+            cnpj = event.cnpj,
+            provider = event.provider,
+            status = event.status,
+            envelopeId = event.getEnvelopeId(),
+            documentsGcsPath = event.metadata["documents_gcs_path"] as? String,
+            signedDocumentsGcsPath = event.metadata["signed_documents_gcs_path"] as? String,
+            createdAt = event.createdAt,
+            updatedAt = event.updatedAt
+        )
+        return ResponseEntity.ok(response)
+    }
+
+    @GetMapping
+    fun listEvents(
+        @PageableDefault(size = 50) pageable: Pageable
+    ): ResponseEntity<Page<SignatureEventResponse>> {
+        // Para estudo: você pode implementar listagem com filtros aqui
+        return ResponseEntity.ok(Page.empty())
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/controller/InternalTasksController.kt": """package com.yourcompany.signature.controller
+
+import com.yourcompany.signature.domain.entity.SignatureEvent
+import com.yourcompany.signature.domain.enums.SignatureStatus
+import com.yourcompany.signature.dto.request.TaskRequest
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.CloudTasksService
+import com.yourcompany.signature.service.SignatureEventService
+import com.yourcompany.signature.service.provider.ProviderSaturatedException
+import io.github.resilience4j.circuitbreaker.CallNotPermittedException
+import org.slf4j.LoggerFactory
+import org.springframework.http.HttpStatus
+import org.springframework.http.ResponseEntity
+import org.springframework.web.bind.annotation.*
+import java.time.Duration
+
+@RestController
+@RequestMapping("/api/internal/assinaturas/tasks")
+class InternalTasksController(
+    private val signatureEventService: SignatureEventService,
+    private val cloudTasksService: CloudTasksService,
+    private val metrics: SignatureMetrics
+) {
+    private val logger = LoggerFactory.getLogger(javaClass)
+
+    @PostMapping("/send")
+    fun sendTask(
+        @RequestBody request: TaskRequest,
+        @RequestHeader(RETRY_COUNT_HEADER, defaultValue = "0") retryCount: Int,
+        @RequestHeader(ETA_HEADER, required = false) eta: String?
+    ) = handle("send-signature-queue", request, SignatureStatus.PENDING, retryCount, MAX_ATTEMPTS_SEND, eta) {
+        signatureEventService.sendToProvider(it)
+    }
+
+    @PostMapping("/check-status")
+    fun checkStatusTask(
+        @RequestBody request: TaskRequest,
+        @RequestHeader(RETRY_COUNT_HEADER, defaultValue = "0") retryCount: Int,
+        @RequestHeader(ETA_HEADER, required = false) eta: String?
+    ) = handle("check-signature-status-queue", request, SignatureStatus.SENT, retryCount, MAX_ATTEMPTS_CHECK_STATUS, eta) {
+        signatureEventService.checkAndUpdateStatus(it)
+        if (it.status == SignatureStatus.SIGNED) {
+            cloudTasksService.createUploadTask(it.id!!)
+        }
+    }
+
+    @PostMapping("/upload")
+    fun uploadTask(
+        @RequestBody request: TaskRequest,
+        @RequestHeader(RETRY_COUNT_HEADER, defaultValue = "0") retryCount: Int,
+        @RequestHeader(ETA_HEADER, required = false) eta: String?
+    ) = handle("upload-signed-queue", request, SignatureStatus.SIGNED, retryCount, MAX_ATTEMPTS_UPLOAD, eta) {
+        signatureEventService.downloadAndUploadSignedDocuments(it)
+    }
+
+    private fun handle(
+        queueName: String,
+        request: TaskRequest,
+        expectedStatus: SignatureStatus,
+        retryCount: Int,
+        maxAttempts: Int,
+        eta: String?,
+        block: (SignatureEvent) -> Unit
+    ): ResponseEntity<Map<String, String>> {
+        eta?.toDoubleOrNull()?.let {
+            metrics.recordTaskLag(queueName, Duration.ofMillis(System.currentTimeMillis() - (it * 1000).toLong()))
+        }
+
+        val event = signatureEventService.findById(request.eventId)
+        if (event == null || event.status != expectedStatus) {
+            // Entrega repetida ou evento já processado: confirma sem retentar
+            return ResponseEntity.ok(mapOf("status" to "SKIPPED"))
+        }
+
+        try {
+            block(event)
+            return ResponseEntity.ok(mapOf("status" to event.status.name))
+        } catch (e: ProviderSaturatedException) {
+            logger.warn("Provider saturated, task for event {} will be retried: {}", event.id, e.message)
+            return ResponseEntity.status(HttpStatus.TOO_MANY_REQUESTS).build()
+        } catch (e: CallNotPermittedException) {
+            logger.warn("Circuit open, task for event {} will be retried: {}", event.id, e.message)
+            return ResponseEntity.status(HttpStatus.SERVICE_UNAVAILABLE).build()
+        } catch (e: Exception) {
+            if (retryCount + 1 >= maxAttempts) {
+                logger.error("Last attempt failed for event {} on {}", event.id, queueName, e)
+                signatureEventService.markAsError(event.id!!, e.message)
+                return ResponseEntity.ok(mapOf("status" to SignatureStatus.ERROR.name))
+            }
+            throw e
+        }
+    }
+
+    companion object {
+        private const val RETRY_COUNT_HEADER = "X-CloudTasks-TaskRetryCount"
+        private const val ETA_HEADER = "X-CloudTasks-TaskETA"
+        const val MAX_ATTEMPTS_SEND = 3
+        const val MAX_ATTEMPTS_CHECK_STATUS = 3
+        const val MAX_ATTEMPTS_UPLOAD = 5
+    }
+}
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/dto/request/TaskRequest.kt": """package com.yourcompany.signature.dto.request
+
+import java.util.*
+
+data class TaskRequest(
+    val eventId: UUID
+)
+""",
+
+    # Schedulers
+    "src/main/kotlin/com/yourcompany/signature/config/SchedulerConfig.kt": """package com.yourcompany.signature.config
+
+import org.springframework.context.annotation.Configuration
+import org.springframework.scheduling.annotation.EnableScheduling
+
+@Configuration
+@EnableScheduling
+class SchedulerConfig
+""",
+
+    "src/main/kotlin/com/yourcompany/signature/scheduler/SignatureStatusScheduler.kt": """package com.yourcompany.signature.scheduler
+
+import com.yourcompany.signature.domain.entity.SignatureEvent
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.CloudTasksService
+import com.yourcompany.signature.service.SignatureEventService
+import org.slf4j.LoggerFactory
+import org.springframework.data.domain.Page
+import org.springframework.data.domain.PageRequest
+import org.springframework.data.domain.Pageable
+import org.springframework.scheduling.annotation.Scheduled
+import org.springframework.stereotype.Component
+import java.util.*
+
+@Component
+class SignatureStatusScheduler(
+    private val signatureEventService: SignatureEventService,
+    private val cloudTasksService: CloudTasksService,
+    private val metrics: SignatureMetrics
+) {
+    private val logger = LoggerFactory.getLogger(javaClass)
+
+    @Scheduled(cron = "\${signature.scheduler.check-status-cron}", zone = TIME_ZONE)
+    fun checkPendingDocumentsStatus() {
+        val enqueued = metrics.recordSweep("check_status") {
+            enqueueAll(signatureEventService::findSentEventsForStatusCheck, cloudTasksService::createCheckStatusTask)
+        }
+        logger.info("Enqueued {} status checks", enqueued)
+    }
+
+    @Scheduled(cron = "\${signature.scheduler.mark-expired-cron}", zone = TIME_ZONE)
+    fun markExpiredEvents() {
+        logger.info("Marked {} events as expired", signatureEventService.markExpiredEvents())
+    }
+
+    @Scheduled(cron = "\${signature.scheduler.process-signed-cron}", zone = TIME_ZONE)
+    fun processSignedDocuments() {
+        val enqueued = metrics.recordSweep("process_signed") {
+            enqueueAll(signatureEventService::findSignedEvents, cloudTasksService::createUploadTask)
+        }
+        logger.info("Enqueued {} signed document uploads", enqueued)
+    }
+
+    // Enfileirar não altera o status, então a paginação por offset não pula eventos
+    private fun enqueueAll(
+        findPage: (Pageable) -> Page<SignatureEvent>,
+        createTask: (UUID, Long) -> String
+    ): Int {
+        var pageable: Pageable = PageRequest.of(0, PAGE_SIZE)
+        var enqueued = 0
+        do {
+            val page = findPage(pageable)
+            page.content.forEach { createTask(it.id!!, 0) }
+            enqueued += page.numberOfElements
+            pageable = page.nextPageable()
+        } while (page.hasNext())
+        return enqueued
+    }
+
+    companion object {
+        const val TIME_ZONE = "America/Sao_Paulo"
+        private const val PAGE_SIZE = 100
+    }
+}
+""",
+    # Testes
+    "src/test/kotlin/com/yourcompany/signature/service/provider/resilience/TokenBucketTest.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import org.junit.jupiter.api.Assertions.assertFalse
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import java.time.Duration
+
+class TokenBucketTest {
+    private var now = 0L
+    private val bucket = TokenBucket(ratePerSecond = 2.0, capacity = 2) { now }
+
+    @Test
+    fun `should allow burst up to capacity`() {
+        assertTrue(bucket.tryAcquire(Duration.ZERO))
+        assertTrue(bucket.tryAcquire(Duration.ZERO))
+        assertFalse(bucket.tryAcquire(Duration.ZERO))
+    }
+
+    @Test
+    fun `should refill tokens over time`() {
+        repeat(2) { bucket.tryAcquire(Duration.ZERO) }
+
+        now += Duration.ofMillis(500).toNanos()
+
+        assertTrue(bucket.tryAcquire(Duration.ZERO))
+        assertFalse(bucket.tryAcquire(Duration.ZERO))
+    }
+
+    @Test
+    fun `should not refill above capacity`() {
+        now += Duration.ofSeconds(10).toNanos()
+
+        repeat(2) { assertTrue(bucket.tryAcquire(Duration.ZERO)) }
+        assertFalse(bucket.tryAcquire(Duration.ZERO))
+    }
+
+    @Test
+    fun `should return refunded token up to capacity`() {
+        repeat(2) { bucket.tryAcquire(Duration.ZERO) }
+
+        bucket.refund()
+        bucket.refund()
+        bucket.refund()
+
+        repeat(2) { assertTrue(bucket.tryAcquire(Duration.ZERO)) }
+        assertFalse(bucket.tryAcquire(Duration.ZERO))
+    }
+
+    @Test
+    fun `should give up when next token arrives after timeout`() {
+        repeat(2) { bucket.tryAcquire(Duration.ZERO) }
+
+        assertFalse(bucket.tryAcquire(Duration.ofMillis(100)))
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/service/provider/resilience/AdaptiveConcurrencyLimiterTest.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertFalse
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import java.time.Duration
+
+class AdaptiveConcurrencyLimiterTest {
+    private var now = 0L
+    private val latencyThreshold = Duration.ofSeconds(1)
+
+    private fun limiter(initialLimit: Int = 10) = AdaptiveConcurrencyLimiter(
+        initialLimit = initialLimit,
+        minLimit = 1,
+        maxLimit = 20,
+        latencyThreshold = latencyThreshold,
+        backoffRatio = 0.5
+    ) { now }
+
+    @Test
+    fun `should reject when in flight reaches limit`() {
+        val limiter = limiter(initialLimit = 2)
+
+        assertTrue(limiter.tryAcquire())
+        assertTrue(limiter.tryAcquire())
+        assertFalse(limiter.tryAcquire())
+        assertEquals(2, limiter.inFlight)
+    }
+
+    @Test
+    fun `should increase limit by one per window of fast successes near the limit`() {
+        val limiter = limiter(initialLimit = 4)
+        repeat(4) { limiter.tryAcquire() }
+
+        repeat(5) {
+            limiter.onSuccess(latencyNanos = 1_000)
+            limiter.tryAcquire()
+        }
+
+        assertEquals(5, limiter.currentLimit)
+        assertEquals(4, limiter.inFlight)
+    }
+
+    @Test
+    fun `should not grow while utilization is low`() {
+        val limiter = limiter(initialLimit = 4)
+
+        repeat(50) {
+            limiter.tryAcquire()
+            limiter.onSuccess(latencyNanos = 1_000)
+        }
+
+        assertEquals(4, limiter.currentLimit)
+        assertEquals(0, limiter.inFlight)
+    }
+
+    @Test
+    fun `should decrease limit once per window when many calls are slow`() {
+        val limiter = limiter(initialLimit = 20)
+        repeat(20) { limiter.tryAcquire() }
+
+        repeat(20) { limiter.onSuccess(latencyNanos = latencyThreshold.toNanos() + 1) }
+
+        assertEquals(10, limiter.currentLimit)
+        assertEquals(0, limiter.inFlight)
+    }
+
+    @Test
+    fun `should decrease again after threshold has elapsed`() {
+        val limiter = limiter(initialLimit = 20)
+        repeat(2) { limiter.tryAcquire() }
+
+        limiter.onDropped()
+        now += latencyThreshold.toNanos()
+        limiter.onDropped()
+
+        assertEquals(5, limiter.currentLimit)
+        assertEquals(0, limiter.inFlight)
+    }
+
+    @Test
+    fun `should not go below min limit`() {
+        val limiter = limiter(initialLimit = 1)
+        limiter.tryAcquire()
+
+        limiter.onDropped()
+
+        assertEquals(1, limiter.currentLimit)
+    }
+
+    @Test
+    fun `should release slot without changing limit when ignored`() {
+        val limiter = limiter(initialLimit = 3)
+        limiter.tryAcquire()
+
+        limiter.onIgnored()
+
+        assertEquals(3, limiter.currentLimit)
+        assertEquals(0, limiter.inFlight)
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/service/provider/resilience/ResilientSignatureProviderTest.kt": """package com.yourcompany.signature.service.provider.resilience
+
+import com.yourcompany.signature.config.ProviderResilienceProperties
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import com.yourcompany.signature.dto.response.StatusCheckResponse
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.provider.ProviderRateLimitedException
+import com.yourcompany.signature.service.provider.ProviderSaturatedException
+import com.yourcompany.signature.service.provider.SignatureProvider
+import io.github.resilience4j.circuitbreaker.CallNotPermittedException
+import io.github.resilience4j.circuitbreaker.CircuitBreaker
+import io.micrometer.core.instrument.observation.DefaultMeterObservationHandler
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import io.micrometer.observation.ObservationRegistry
+import io.mockk.every
+import io.mockk.mockk
+import io.mockk.verify
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Assertions.assertSame
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+import org.springframework.http.HttpStatus
+import org.springframework.web.client.HttpServerErrorException
+import org.springframework.web.client.ResourceAccessException
+import java.time.Duration
+
+class ResilientSignatureProviderTest {
+    private val delegate = mockk<SignatureProvider>()
+    private val circuitBreaker = CircuitBreaker.ofDefaults("test")
+    private val limits = ProviderResilienceProperties.Limits(
+        requestsPerSecond = 1000.0,
+        burst = 100,
+        acquireTimeout = Duration.ZERO,
+        initialConcurrency = 4,
+        minConcurrency = 1,
+        maxConcurrency = 10,
+        latencyThreshold = Duration.ofSeconds(5),
+        backoffRatio = 0.5
+    )
+    private val meterRegistry = SimpleMeterRegistry()
+    private val metrics = SignatureMetrics(
+        meterRegistry,
+        ObservationRegistry.create().apply {
+            observationConfig().observationHandler(DefaultMeterObservationHandler(meterRegistry))
+        }
+    )
+    private lateinit var provider: ResilientSignatureProvider
+
+    @BeforeEach
+    fun setUp() {
+        every { delegate.getProviderType() } returns ProviderType.CERTISIGN
+        provider = ResilientSignatureProvider(delegate, limits, circuitBreaker, metrics)
+    }
+
+    private fun rejections(reason: String) =
+        meterRegistry.find("signature.provider.rejected").tag("reason", reason).counter()?.count() ?: 0.0
+
+    @Test
+    fun `should release slot and record success`() {
+        val response = StatusCheckResponse("completed", null, emptyMap())
+        every { delegate.checkStatus("ENV-1") } returns response
+
+        assertSame(response, provider.checkStatus("ENV-1"))
+
+        assertEquals(0, provider.concurrencyLimiter.inFlight)
+        assertEquals(1, circuitBreaker.metrics.numberOfSuccessfulCalls)
+        assertEquals(1, meterRegistry.get("signature.provider.call").tag("operation", "check_status").timer().count())
+    }
+
+    @Test
+    fun `should shrink limit without counting breaker failure when provider throttles`() {
+        every { delegate.checkStatus("ENV-1") } throws ProviderRateLimitedException(ProviderType.CERTISIGN)
+
+        assertThrows<ProviderRateLimitedException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(0, provider.concurrencyLimiter.inFlight)
+        assertEquals(2, provider.concurrencyLimiter.currentLimit)
+        assertEquals(0, circuitBreaker.metrics.numberOfBufferedCalls)
+    }
+
+    @Test
+    fun `should release slot and record breaker failure on error`() {
+        every { delegate.checkStatus("ENV-1") } throws IllegalStateException("boom")
+
+        assertThrows<IllegalStateException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(0, provider.concurrencyLimiter.inFlight)
+        assertEquals(4, provider.concurrencyLimiter.currentLimit)
+        assertEquals(1, circuitBreaker.metrics.numberOfFailedCalls)
+    }
+
+    @Test
+    fun `should shrink limit and record breaker failure when provider times out`() {
+        every { delegate.checkStatus("ENV-1") } throws ResourceAccessException("Read timed out")
+
+        assertThrows<ResourceAccessException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(0, provider.concurrencyLimiter.inFlight)
+        assertEquals(2, provider.concurrencyLimiter.currentLimit)
+        assertEquals(1, circuitBreaker.metrics.numberOfFailedCalls)
+    }
+
+    @Test
+    fun `should shrink limit when provider returns 5xx`() {
+        every { delegate.checkStatus("ENV-1") } throws HttpServerErrorException(HttpStatus.SERVICE_UNAVAILABLE)
+
+        assertThrows<HttpServerErrorException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(2, provider.concurrencyLimiter.currentLimit)
+    }
+
+    @Test
+    fun `should reject without calling provider when concurrency is exhausted`() {
+        repeat(4) { provider.concurrencyLimiter.tryAcquire() }
+
+        assertThrows<ProviderSaturatedException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(4, provider.concurrencyLimiter.inFlight)
+        assertEquals(0, circuitBreaker.metrics.numberOfBufferedCalls)
+        assertEquals(1.0, rejections("concurrency_limit"))
+        assertNull(meterRegistry.find("signature.provider.call").timer())
+        verify(exactly = 0) { delegate.checkStatus(any()) }
+    }
+
+    @Test
+    fun `should refund rate limit token when concurrency is exhausted`() {
+        val provider = ResilientSignatureProvider(
+            delegate,
+            limits.copy(requestsPerSecond = 0.001, burst = 1),
+            circuitBreaker,
+            metrics
+        )
+        every { delegate.checkStatus("ENV-1") } returns StatusCheckResponse("completed", null, emptyMap())
+        repeat(4) { provider.concurrencyLimiter.tryAcquire() }
+
+        assertThrows<ProviderSaturatedException> { provider.checkStatus("ENV-1") }
+        provider.concurrencyLimiter.onIgnored()
+        provider.checkStatus("ENV-1")
+
+        assertEquals(0.0, rejections("rate_limit"))
+    }
+
+    @Test
+    fun `should reject without taking a slot when breaker is open`() {
+        circuitBreaker.transitionToOpenState()
+
+        assertThrows<CallNotPermittedException> { provider.checkStatus("ENV-1") }
+
+        assertEquals(0, provider.concurrencyLimiter.inFlight)
+        assertEquals(1.0, rejections("circuit_open"))
+        verify(exactly = 0) { delegate.checkStatus(any()) }
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/service/provider/auth/ProviderTokenManagerTest.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+import java.time.Clock
+import java.time.Duration
+import java.time.Instant
+import java.time.ZoneId
+import java.time.ZoneOffset
+import java.util.concurrent.CountDownLatch
+import java.util.concurrent.Executors
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.atomic.AtomicInteger
+
+class ProviderTokenManagerTest {
+    private val clock = MutableClock(Instant.parse("2024-01-01T00:00:00Z"))
+    private val source = FakeTokenSource()
+    private val manager = ProviderTokenManager(
+        tokenSources = listOf(source),
+        refreshSkew = Duration.ofSeconds(60),
+        failureBackoff = Duration.ofSeconds(5),
+        clock = clock
+    )
+
+    @Test
+    fun `should reuse cached token until refresh skew`() {
+        source.next = { AccessToken("token-${source.fetches.get()}", clock.instant().plusSeconds(600)) }
+
+        assertEquals("token-1", manager.getToken(ProviderType.DOCUSIGN))
+        clock.advance(Duration.ofSeconds(539))
+        assertEquals("token-1", manager.getToken(ProviderType.DOCUSIGN))
+
+        clock.advance(Duration.ofSeconds(1))
+        assertEquals("token-2", manager.getToken(ProviderType.DOCUSIGN))
+        assertEquals(2, source.fetches.get())
+    }
+
+    @Test
+    fun `should fetch once when threads refresh concurrently`() {
+        val release = CountDownLatch(1)
+        source.next = {
+            release.await(5, TimeUnit.SECONDS)
+            AccessToken("token", clock.instant().plusSeconds(600))
+        }
+        val executor = Executors.newFixedThreadPool(8)
+
+        val results = (1..8).map { executor.submit<String> { manager.getToken(ProviderType.DOCUSIGN) } }
+        Thread.sleep(100)
+        release.countDown()
+
+        results.forEach { assertEquals("token", it.get(5, TimeUnit.SECONDS)) }
+        assertEquals(1, source.fetches.get())
+        executor.shutdown()
+    }
+
+    @Test
+    fun `should back off after a failed refresh`() {
+        source.next = { throw IllegalStateException("auth endpoint down") }
+
+        assertThrows<IllegalStateException> { manager.getToken(ProviderType.DOCUSIGN) }
+        assertThrows<IllegalStateException> { manager.getToken(ProviderType.DOCUSIGN) }
+        assertEquals(1, source.fetches.get())
+
+        source.next = { AccessToken("token", clock.instant().plusSeconds(600)) }
+        clock.advance(Duration.ofSeconds(5))
+
+        assertEquals("token", manager.getToken(ProviderType.DOCUSIGN))
+        assertEquals(2, source.fetches.get())
+    }
+
+    @Test
+    fun `should fetch again after invalidate`() {
+        source.next = { AccessToken("token-${source.fetches.get()}", clock.instant().plusSeconds(600)) }
+
+        manager.getToken(ProviderType.DOCUSIGN)
+        manager.invalidate(ProviderType.DOCUSIGN)
+
+        assertEquals("token-2", manager.getToken(ProviderType.DOCUSIGN))
+    }
+
+    @Test
+    fun `should reject provider without token source`() {
+        assertThrows<IllegalArgumentException> { manager.getToken(ProviderType.CERTISIGN) }
+    }
+
+    private class FakeTokenSource : ProviderTokenSource {
+        val fetches = AtomicInteger()
+        var next: () -> AccessToken = { AccessToken.nonExpiring("token") }
+
+        override fun fetchToken(): AccessToken {
+            fetches.incrementAndGet()
+            return next()
+        }
+
+        override fun getProviderType() = ProviderType.DOCUSIGN
+    }
+
+    private class MutableClock(private var now: Instant) : Clock() {
+        fun advance(duration: Duration) {
+            now = now.plus(duration)
+        }
+
+        override fun instant(): Instant = now
+
+        override fun getZone(): ZoneId = ZoneOffset.UTC
+
+        override fun withZone(zone: ZoneId): Clock = this
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/service/provider/auth/DocusignTokenSourceTest.kt": """package com.yourcompany.signature.service.provider.auth
+
+import com.fasterxml.jackson.databind.ObjectMapper
+import io.mockk.mockk
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+import org.springframework.web.client.RestClient
+import java.time.Duration
+import java.time.Instant
+
+class DocusignTokenSourceTest {
+    private fun tokenSource(accessToken: String = "", integrationKey: String = "") = DocusignTokenSource(
+        restClientBuilder = RestClient.builder(),
+        objectMapper = ObjectMapper(),
+        environment = mockk(),
+        staticAccessToken = accessToken,
+        authBaseUrl = "https://account-d.docusign.com",
+        integrationKey = integrationKey,
+        userId = "",
+        tokenLifetime = Duration.ofHours(1)
+    )
+
+    @Test
+    fun `should fail at startup without integration key or access token`() {
+        assertThrows<IllegalStateException> { tokenSource() }
+    }
+
+    @Test
+    fun `should return static access token when integration key is not set`() {
+        val token = tokenSource(accessToken = "static").fetchToken()
+
+        assertEquals("static", token.value)
+        assertEquals(Instant.MAX, token.expiresAt)
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/controller/InternalTasksControllerTest.kt": """package com.yourcompany.signature.controller
+
+import com.yourcompany.signature.domain.entity.SignatureEvent
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import com.yourcompany.signature.domain.enums.SignatureStatus
+import com.yourcompany.signature.dto.request.TaskRequest
+import com.yourcompany.signature.metrics.SignatureMetrics
+import com.yourcompany.signature.service.CloudTasksService
+import com.yourcompany.signature.service.SignatureEventService
+import com.yourcompany.signature.service.provider.ProviderSaturatedException
+import io.mockk.every
+import io.mockk.just
+import io.mockk.mockk
+import io.mockk.runs
+import io.mockk.verify
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+import org.springframework.http.HttpStatus
+import java.util.*
+
+class InternalTasksControllerTest {
+    private val service = mockk<SignatureEventService>()
+    private val cloudTasksService = mockk<CloudTasksService>()
+    private val metrics = mockk<SignatureMetrics>(relaxed = true)
+    private val controller = InternalTasksController(service, cloudTasksService, metrics)
+
+    private val eventId = UUID.randomUUID()
+    private fun event(status: SignatureStatus) = SignatureEvent(
+        id = eventId,
+        campaignId = "CAMP-1",
+        cnpj = "12345678000199",
+        provider = ProviderType.CERTISIGN,
+        status = status
+    )
+
+    @Test
+    fun `should answer 429 without marking error when provider is saturated`() {
+        val event = event(SignatureStatus.PENDING)
+        every { service.findById(eventId) } returns event
+        every { service.sendToProvider(event) } throws ProviderSaturatedException(ProviderType.CERTISIGN, "full")
+
+        val response = controller.sendTask(TaskRequest(eventId), retryCount = 2, eta = null)
+
+        assertEquals(HttpStatus.TOO_MANY_REQUESTS, response.statusCode)
+        verify(exactly = 0) { service.markAsError(any(), any()) }
+    }
+
+    @Test
+    fun `should rethrow so Cloud Tasks retries before the last attempt`() {
+        val event = event(SignatureStatus.PENDING)
+        every { service.findById(eventId) } returns event
+        every { service.sendToProvider(event) } throws IllegalStateException("boom")
+
+        assertThrows<IllegalStateException> { controller.sendTask(TaskRequest(eventId), retryCount = 0, eta = null) }
+
+        verify(exactly = 0) { service.markAsError(any(), any()) }
+    }
+
+    @Test
+    fun `should mark error on the last attempt`() {
+        val event = event(SignatureStatus.PENDING)
+        every { service.findById(eventId) } returns event
+        every { service.sendToProvider(event) } throws IllegalStateException("boom")
+        every { service.markAsError(eventId, "boom") } just runs
+
+        val response = controller.sendTask(
+            TaskRequest(eventId),
+            retryCount = InternalTasksController.MAX_ATTEMPTS_SEND - 1,
+            eta = null
+        )
+
+        assertEquals(HttpStatus.OK, response.statusCode)
+        assertEquals("ERROR", response.body!!["status"])
+    }
+
+    @Test
+    fun `should skip event that already left the expected status`() {
+        every { service.findById(eventId) } returns event(SignatureStatus.SENT)
+
+        val response = controller.sendTask(TaskRequest(eventId), retryCount = 0, eta = null)
+
+        assertEquals("SKIPPED", response.body!!["status"])
+        verify(exactly = 0) { service.sendToProvider(any()) }
+    }
+
+    @Test
+    fun `should enqueue upload when status check finds the envelope signed`() {
+        val event = event(SignatureStatus.SENT)
+        every { service.findById(eventId) } returns event
+        every { service.checkAndUpdateStatus(event) } answers { event.status = SignatureStatus.SIGNED }
+        every { cloudTasksService.createUploadTask(eventId) } returns "task-1"
+
+        controller.checkStatusTask(TaskRequest(eventId), retryCount = 0, eta = null)
+
+        verify { cloudTasksService.createUploadTask(eventId) }
+    }
+
+    @Test
+    fun `should record delivery lag from task ETA header`() {
+        every { service.findById(eventId) } returns null
+        val eta = (System.currentTimeMillis() - 2_000) / 1000.0
+
+        controller.sendTask(TaskRequest(eventId), retryCount = 0, eta = eta.toString())
+
+        verify { metrics.recordTaskLag("send-signature-queue", match { it.toMillis() >= 2_000 }) }
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/domain/enums/SignatureProviderTest.kt": """package com.yourcompany.signature.domain.enums
+
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Test
+
+class SignatureProviderTest {
+    @Test
+    fun `should resolve code ignoring case`() {
+        assertEquals(SignatureProvider.CERTISIGN, SignatureProvider.fromCode("CERTISIGN"))
+        assertEquals(SignatureProvider.DOCUSIGN, SignatureProvider.fromCode("docusign"))
+        assertEquals(SignatureProvider.DOCUSIGN, SignatureProvider.fromCode("DocuSign"))
+    }
+
+    @Test
+    fun `should return null for unknown code`() {
+        assertNull(SignatureProvider.fromCode("ADOBESIGN"))
+        assertNull(SignatureProvider.fromCode(""))
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/service/provider/ProviderStatusMappingTest.kt": """package com.yourcompany.signature.service.provider
+
+import com.yourcompany.signature.domain.enums.SignatureProvider as ProviderType
+import com.yourcompany.signature.domain.enums.SignatureStatus
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Test
+
+class ProviderStatusMappingTest {
+    @Test
+    fun `should resolve provider status ignoring case`() {
+        assertEquals(SignatureStatus.SIGNED, ProviderStatusMapping.resolve(ProviderType.CERTISIGN, "completed"))
+        assertEquals(SignatureStatus.SENT, ProviderStatusMapping.resolve(ProviderType.CERTISIGN, "Pending"))
+        assertEquals(SignatureStatus.REJECTED, ProviderStatusMapping.resolve(ProviderType.DOCUSIGN, "DECLINED"))
+        assertEquals(SignatureStatus.SENT, ProviderStatusMapping.resolve(ProviderType.DOCUSIGN, "delivered"))
+    }
+
+    @Test
+    fun `should keep mappings separate per provider`() {
+        assertNull(ProviderStatusMapping.resolve(ProviderType.DOCUSIGN, "WAITING"))
+        assertEquals(SignatureStatus.SENT, ProviderStatusMapping.resolve(ProviderType.CERTISIGN, "WAITING"))
+    }
+
+    @Test
+    fun `should return null for unknown status`() {
+        assertNull(ProviderStatusMapping.resolve(ProviderType.CERTISIGN, "archived"))
+        assertNull(ProviderStatusMapping.resolve(ProviderType.DOCUSIGN, ""))
+    }
+}
+""",
+
+    "src/test/kotlin/com/yourcompany/signature/dto/request/SupportedProviderValidatorTest.kt": """package com.yourcompany.signature.dto.request
+
+import io.mockk.mockk
+import jakarta.validation.ConstraintValidatorContext
+import org.junit.jupiter.api.Assertions.assertFalse
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+
+class SupportedProviderValidatorTest {
+    private val validator = SupportedProviderValidator()
+    private val context = mockk<ConstraintValidatorContext>()
+
+    @Test
+    fun `should accept known provider in any case`() {
+        assertTrue(validator.isValid("CERTISIGN", context))
+        assertTrue(validator.isValid("docusign", context))
+    }
+
+    @Test
+    fun `should reject unknown provider`() {
+        assertFalse(validator.isValid("ADOBESIGN", context))
+    }
+
+    @Test
+    fun `should leave null and blank to NotBlank`() {
+        assertTrue(validator.isValid(null, context))
+        assertTrue(validator.isValid(" ", context))
+    }
+}
+""",
+
 }
 
 # Conteúdos dos MD já foram gerados antes, mas aqui vou simplificar:
@@ -861,6 +3179,13 @@ FILES["TODO.md"] = TODO_MD
 
 
 def write_project():
+    errors = validate_files(FILES)
+    if errors:
+        print("Validação dos arquivos renderizados falhou:")
+        for error in errors:
+            print(f"  ✘ {error}")
+        sys.exit(1)
+
     print(f"Criando projeto em: {BASE_DIR.resolve()}")
     for path, content in FILES.items():
         full_path = BASE_DIR / path
@@ -0,0 +1,102 @@
+from validate_signature_project import validate_files, validate_kotlin, validate_pom, validate_sql
+
+KOTLIN_PATH = "src/main/kotlin/com/example/signature/Example.kt"
+
+
+def kotlin(body):
+    return f"package com.example.signature\n\n{body}\n"
+
+
+def test_kotlin_valido_passa():
+    assert validate_kotlin(KOTLIN_PATH, kotlin('class Example {\n    val query = """select 1"""\n}')) == []
+
+
+def test_kotlin_rejeita_aspas_simples_triplas():
+    errors = validate_kotlin(KOTLIN_PATH, kotlin("val query = '''select 1'''"))
+    assert any("'''" in error for error in errors)
+
+
+def test_kotlin_rejeita_package_diferente_do_caminho():
+    content = "package com.example.other\n\nclass Example\n"
+    errors = validate_kotlin(KOTLIN_PATH, content)
+    assert any("não corresponde ao caminho" in error for error in errors)
+
+
+def test_kotlin_rejeita_chaves_desbalanceadas():
+    errors = validate_kotlin(KOTLIN_PATH, kotlin("class Example {\n    fun run() {\n}"))
+    assert errors == [f"{KOTLIN_PATH}:3: '{{' não fechado"]
+
+
+def test_kotlin_rejeita_value_sem_escape():
+    content = kotlin('class Example(@Value("${app.bucket}") val bucket: String)')
+    errors = validate_kotlin(KOTLIN_PATH, content)
+    assert any("@Value" in error for error in errors)
+
+
+def test_kotlin_aceita_value_com_escape():
+    content = kotlin('class Example(@Value("\\${app.bucket}") val bucket: String)')
+    assert validate_kotlin(KOTLIN_PATH, content) == []
+
+
+def test_sql_rejeita_ultima_instrucao_sem_ponto_e_virgula():
+    content = "CREATE TABLE a (id BIGINT);\nCREATE INDEX idx_a ON a (id)\n"
+    errors = validate_sql("src/main/resources/db/migration/V1__init.sql", content)
+    assert errors == ["src/main/resources/db/migration/V1__init.sql: última instrução sem ';'"]
+
+
+def test_sql_ignora_ponto_e_virgula_em_literal_e_comentario():
+    content = "INSERT INTO a (name) VALUES ('x;y'); -- fim;\n"
+    assert validate_sql("src/main/resources/db/migration/V1__init.sql", content) == []
+
+
+def test_sql_ignora_comentario_de_bloco():
+    content = "/* don't */ CREATE TABLE a (id INT);\n/*\n  várias linhas; sem ')'\n*/\n"
+    assert validate_sql("src/main/resources/db/migration/V1__init.sql", content) == []
+
+
+def test_sql_ignora_corpo_com_dollar_quoting():
+    content = (
+        "CREATE FUNCTION touch() RETURNS trigger AS $body$\n"
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END; -- it's\n"
+        "$body$ LANGUAGE plpgsql;\n"
+        "DO $$ BEGIN PERFORM 1; END $$;\n"
+    )
+    assert validate_sql("src/main/resources/db/migration/V1__init.sql", content) == []
+
+
+def test_sql_rejeita_comentario_de_bloco_nao_fechado():
+    errors = validate_sql("src/main/resources/db/migration/V1__init.sql", "CREATE TABLE a (id INT); /* fim\n")
+    assert errors == ["src/main/resources/db/migration/V1__init.sql:1: comentário de bloco não fechado"]
+
+
+def test_migrations_com_versao_duplicada():
+    files = {
+        "src/main/resources/db/migration/V1__init.sql": "CREATE TABLE a (id BIGINT);\n",
+        "src/main/resources/db/migration/V1__outra.sql": "CREATE TABLE b (id BIGINT);\n",
+    }
+    errors = validate_files(files)
+    assert errors == [
+        "src/main/resources/db/migration/V1__outra.sql: versão V1 duplicada (src/main/resources/db/migration/V1__init.sql)"
+    ]
+
+
+def test_pom_aceita_propriedades_herdadas_e_rejeita_indefinidas():
+    content = """<project>
+    <modelVersion>4.0.0</modelVersion>
+    <groupId>com.example</groupId>
+    <artifactId>demo</artifactId>
+    <version>1.0</version>
+    <properties><resilience4j.version>2.2.0</resilience4j.version></properties>
+    <build>
+        <directory>${basedir}/target</directory>
+        <finalName>${project.artifactId}-${spring-boot.version}-${resilience4j.version}-${kotlin.version}</finalName>
+        <outputDirectory>${otel.version}</outputDirectory>
+    </build>
+</project>"""
+    assert validate_pom("pom.xml", content) == ["pom.xml: propriedade ${otel.version} não definida em <properties>"]
+
+
+def test_projeto_gerado_passa_na_validacao():
+    from generate_signature_project import FILES
+
+    assert validate_files(FILES) == []
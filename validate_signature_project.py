@@ -0,0 +1,259 @@
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import PurePosixPath
+
+try:
+    import yaml
+except ImportError:  # PyYAML é opcional: sem ele, só a checagem estrutural básica roda
+    yaml = None
+
+KOTLIN_ROOTS = ("src/main/kotlin/", "src/test/kotlin/")
+MIGRATION_NAME = re.compile(r"^V(\d+)__\w+\.sql$")
+DOLLAR_QUOTE = re.compile(r"\$(\w*)\$")
+POM_PROPERTY_REF = re.compile(r"\$\{([^}]+)\}")
+UNESCAPED_VALUE_TEMPLATE = re.compile(r'@Value\("\$\{')
+BRACKETS = {")": "(", "]": "[", "}": "{"}
+# Propriedades embutidas no Maven ou herdadas do spring-boot-starter-parent
+INHERITED_POM_PROPERTY_PREFIXES = ("project.", "spring-boot.", "env.", "settings.", "maven.")
+INHERITED_POM_PROPERTIES = {"basedir", "java.version", "kotlin.version"}
+
+
+def validate_files(files):
+    """Valida todos os arquivos renderizados e retorna a lista de erros."""
+    if yaml is None and any(path.endswith((".yml", ".yaml")) for path in files):
+        print("aviso: PyYAML não instalado, parse dos arquivos YAML ignorado (pip install pyyaml)", file=sys.stderr)
+    errors = [error for path, content in files.items() for error in validate_file(path, content)]
+    errors.extend(validate_migration_versions(files))
+    return errors
+
+
+def validate_file(path, content):
+    if path.endswith(".kt"):
+        return validate_kotlin(path, content)
+    if path.endswith(".sql"):
+        return validate_sql(path, content)
+    if path.endswith((".yml", ".yaml")):
+        return validate_yaml(path, content)
+    if path.endswith("pom.xml"):
+        return validate_pom(path, content)
+    return []
+
+
+def validate_kotlin(path, content):
+    errors = []
+    root = next((r for r in KOTLIN_ROOTS if path.startswith(r)), None)
+    if root is None:
+        errors.append(f"{path}: arquivo Kotlin fora de {' ou '.join(KOTLIN_ROOTS)}")
+    else:
+        expected_package = str(PurePosixPath(path[len(root):]).parent).replace("/", ".")
+        match = re.search(r"^package\s+([\w.]+)", content, re.MULTILINE)
+        if match is None:
+            errors.append(f"{path}: declaração package ausente")
+        elif match.group(1) != expected_package:
+            errors.append(f"{path}: package {match.group(1)} não corresponde ao caminho ({expected_package})")
+
+    for line_number, line in enumerate(content.splitlines(), start=1):
+        if UNESCAPED_VALUE_TEMPLATE.search(line):
+            errors.append(f"{path}:{line_number}: @Value com '${{' sem escape (use '\\${{' no template)")
+
+    errors.extend(f"{path}:{error}" for error in _check_kotlin_brackets(content))
+    return errors
+
+
+def _check_kotlin_brackets(content):
+    stack = []
+    i = 0
+    line = 1
+    length = len(content)
+    while i < length:
+        char = content[i]
+        if char == "\n":
+            line += 1
+        elif content.startswith("//", i):
+            i = content.find("\n", i)
+            if i == -1:
+                break
+            continue
+        elif content.startswith("/*", i):
+            end = content.find("*/", i + 2)
+            if end == -1:
+                return [f"{line}: comentário de bloco não fechado"]
+            line += content.count("\n", i, end)
+            i = end + 2
+            continue
+        elif content.startswith("'''", i):
+            return [f"{line}: ''' não é delimitador de string em Kotlin (use \"\"\")"]
+        elif content.startswith('"""', i):
+            end = content.find('"""', i + 3)
+            if end == -1:
+                return [f"{line}: raw string não fechada"]
+            while content.startswith('"', end + 3):
+                end += 1
+            line += content.count("\n", i, end)
+            i = end + 3
+            continue
+        elif char in "\"'":
+            end = i + 1
+            while end < length and content[end] != char:
+                if content[end] == "\n":
+                    return [f"{line}: literal {char} não fechado"]
+                end += 2 if content[end] == "\\" else 1
+            i = end + 1
+            continue
+        elif char in "([{":
+            stack.append((char, line))
+        elif char in ")]}":
+            if not stack:
+                return [f"{line}: '{char}' sem abertura correspondente"]
+            if stack[-1][0] != BRACKETS[char]:
+                return [f"{line}: '{char}' fecha '{stack[-1][0]}' aberto na linha {stack[-1][1]}"]
+            stack.pop()
+        i += 1
+    return [f"{opened_line}: '{opened}' não fechado" for opened, opened_line in stack]
+
+
+def validate_sql(path, content):
+    errors = []
+    name = PurePosixPath(path).name
+    if "/db/migration/" in path and not MIGRATION_NAME.match(name):
+        errors.append(f"{path}: nome de migration fora do padrão Flyway V<versão>__<descrição>.sql")
+
+    code = []
+    depth = 0
+    i = 0
+    line = 1
+    length = len(content)
+    while i < length:
+        char = content[i]
+        if char == "\n":
+            line += 1
+        if content.startswith("--", i):
+            i = content.find("\n", i)
+            if i == -1:
+                break
+            continue
+        if content.startswith("/*", i):
+            end = content.find("*/", i + 2)
+            if end == -1:
+                return errors + [f"{path}:{line}: comentário de bloco não fechado"]
+            line += content.count("\n", i, end)
+            i = end + 2
+            continue
+        dollar = DOLLAR_QUOTE.match(content, i) if char == "$" else None
+        if dollar:
+            end = content.find(dollar.group(0), dollar.end())
+            if end == -1:
+                return errors + [f"{path}:{line}: literal {dollar.group(0)} não fechado"]
+            line += content.count("\n", i, end)
+            code.append("_")
+            i = end + len(dollar.group(0))
+            continue
+        if char in "'\"":
+            end = i + 1
+            while True:
+                end = content.find(char, end)
+                if end == -1:
+                    return errors + [f"{path}:{line}: literal {char} não fechado"]
+                if content.startswith(char * 2, end):
+                    end += 2
+                    continue
+                break
+            line += content.count("\n", i, end)
+            code.append("_")
+            i = end + 1
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return errors + [f"{path}:{line}: ')' sem abertura correspondente"]
+        code.append(char)
+        i += 1
+
+    if depth:
+        errors.append(f"{path}: parênteses desbalanceados")
+    if "".join(code).rsplit(";", 1)[-1].strip():
+        errors.append(f"{path}: última instrução sem ';'")
+    return errors
+
+
+def validate_migration_versions(files):
+    errors = []
+    seen = {}
+    for path in files:
+        match = MIGRATION_NAME.match(PurePosixPath(path).name)
+        if "/db/migration/" not in path or match is None:
+            continue
+        version = int(match.group(1))
+        if version in seen:
+            errors.append(f"{path}: versão V{version} duplicada ({seen[version]})")
+        seen[version] = path
+    return errors
+
+
+def validate_yaml(path, content):
+    if "\t" in content:
+        return [f"{path}: YAML com tabulação"]
+    if yaml is None:
+        return []
+    try:
+        documents = list(yaml.safe_load_all(content))
+    except yaml.YAMLError as e:
+        return [f"{path}: YAML inválido: {e}"]
+    if PurePosixPath(path).name.startswith("application") and not all(isinstance(d, dict) for d in documents):
+        return [f"{path}: configuração Spring deve ser um mapa"]
+    return []
+
+
+def validate_pom(path, content):
+    try:
+        project = ET.fromstring(content)
+    except ET.ParseError as e:
+        return [f"{path}: XML inválido: {e}"]
+
+    namespace = project.tag[: project.tag.index("}") + 1] if project.tag.startswith("{") else ""
+    errors = []
+    if project.tag != f"{namespace}project":
+        errors.append(f"{path}: elemento raiz deve ser <project>")
+    for field in ("modelVersion", "groupId", "artifactId", "version"):
+        if project.find(f"{namespace}{field}") is None:
+            errors.append(f"{path}: <{field}> ausente")
+
+    properties = project.find(f"{namespace}properties")
+    defined = {child.tag[len(namespace):] for child in properties} if properties is not None else set()
+    for ref in sorted(set(POM_PROPERTY_REF.findall(content))):
+        if ref in defined or ref in INHERITED_POM_PROPERTIES or ref.startswith(INHERITED_POM_PROPERTY_PREFIXES):
+            continue
+        errors.append(f"{path}: propriedade ${{{ref}}} não definida em <properties>")
+
+    for dependencies in project.iter(f"{namespace}dependencies"):
+        seen = set()
+        for dependency in dependencies.findall(f"{namespace}dependency"):
+            group_id = dependency.findtext(f"{namespace}groupId")
+            artifact_id = dependency.findtext(f"{namespace}artifactId")
+            if not group_id or not artifact_id:
+                errors.append(f"{path}: dependência sem groupId/artifactId")
+                continue
+            if (group_id, artifact_id) in seen:
+                errors.append(f"{path}: dependência duplicada {group_id}:{artifact_id}")
+            seen.add((group_id, artifact_id))
+    return errors
+
+
+def main():
+    from generate_signature_project import FILES
+
+    start = time.perf_counter()
+    errors = validate_files(FILES)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for error in errors:
+        print(f"  ✘ {error}")
+    print(f"{len(FILES)} arquivos validados em {elapsed_ms:.0f}ms, {len(errors)} erro(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())